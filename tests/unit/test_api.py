@@ -80,6 +80,7 @@ class TestRunEndpoints:
         data = response.json()
         assert "id" in data
         assert data["status"] == "pending"
+        assert data["primer_scheme"] == "ARTIC-V4"
     
     def test_list_runs(self, authenticated_client):
         response = authenticated_client.get("/api/v1/runs")
@@ -88,6 +89,14 @@ class TestRunEndpoints:
         assert "items" in data
         assert "total" in data
 
+    def test_list_runs_rejects_malformed_cursor(self, authenticated_client):
+        response = authenticated_client.get("/api/v1/runs", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    def test_list_runs_rejects_skip_with_cursor(self, authenticated_client):
+        response = authenticated_client.get("/api/v1/runs", params={"cursor": "abc", "skip": 10})
+        assert response.status_code == 400
+
 
 @pytest.fixture
 def client():
@@ -2,6 +2,8 @@
 Tests for provenance tracking.
 """
 
+import hashlib
+
 import pytest
 from pathlib import Path
 from uuid import UUID
@@ -9,6 +11,8 @@ from uuid import UUID
 from vgap.utils.provenance import (
     ProvenanceCollector,
     generate_checksums_file,
+    sha256_file,
+    sha256_files,
     verify_checksums,
 )
 
@@ -29,6 +33,20 @@ class TestProvenanceCollector:
         assert p.software[0]["name"] == "fastp"
         assert p.software[0]["version"] == "0.23.4"
     
+    def test_add_software_updates_existing(self, tmp_path):
+        p = ProvenanceCollector()
+        p.add_software("fastp", "0.23.4")
+        p.add_software("ivar", "1.4.2")
+        p.add_software("fastp", "0.24.0", container="fastp:0.24.0")
+        
+        assert [s["name"] for s in p.software] == ["fastp", "ivar"]
+        assert p.software[0]["version"] == "0.24.0"
+        
+        p.save(tmp_path / "provenance.json")
+        loaded = ProvenanceCollector.load(tmp_path / "provenance.json")
+        loaded.add_software("ivar", "1.4.3")
+        assert [s["version"] for s in loaded.software] == ["0.24.0", "1.4.3"]
+    
     def test_add_command(self):
         p = ProvenanceCollector()
         p.add_command("fastp", ["fastp", "-i", "input.fq", "-o", "output.fq"])
@@ -74,6 +92,22 @@ class TestProvenanceCollector:
 class TestChecksums:
     """Tests for checksum generation and verification."""
     
+    def test_sha256_file_multiple_chunks(self, tmp_path, monkeypatch):
+        import vgap.utils.provenance as provenance
+        monkeypatch.setattr(provenance, "CHECKSUM_CHUNK_SIZE", 7)
+        data = b"ACGT" * 100
+        (tmp_path / "reads.fastq").write_bytes(data)
+        
+        assert sha256_file(tmp_path / "reads.fastq") == hashlib.sha256(data).hexdigest()
+    
+    def test_sha256_files_preserves_order(self, tmp_path):
+        paths = []
+        for i in range(5):
+            paths.append(tmp_path / f"file{i}.txt")
+            paths[-1].write_text(f"content{i}")
+        
+        assert sha256_files(paths) == [sha256_file(p) for p in paths]
+    
     def test_generate_checksums(self, tmp_path):
         # Create test files
         (tmp_path / "file1.txt").write_text("content1")
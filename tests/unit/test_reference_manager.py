@@ -0,0 +1,451 @@
+"""
+Tests for reference database management.
+"""
+
+import gzip
+import hashlib
+import json
+
+import httpx
+import pytest
+
+from vgap.services import reference_manager
+from vgap.services.reference_manager import ReferenceManager
+
+FASTA = b">NC_045512.2 test\nACGTACGTAC\nGTACGT\n"
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ReferenceManager(references_dir=tmp_path / "references")
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Route downloads through an in-memory transport."""
+    responses = {}
+
+    def handler(request):
+        body = responses.get(str(request.url))
+        if body is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=body)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(reference_manager, "_http_client", lambda: client)
+    return responses
+
+
+class TestDownload:
+    """Tests for streamed downloads."""
+
+    def test_download_writes_file(self, manager, mock_http, tmp_path):
+        mock_http["https://example.org/ref.fasta"] = FASTA
+        dest = tmp_path / "ref.fasta"
+
+        ok, checksum, _ = manager._download_file("https://example.org/ref.fasta", dest)
+
+        assert ok
+        assert checksum is None
+        assert dest.read_bytes() == FASTA
+
+    def test_download_streams_checksum(self, manager, mock_http, tmp_path):
+        mock_http["https://example.org/ref.fasta"] = FASTA
+        dest = tmp_path / "ref.fasta"
+
+        ok, checksum, _ = manager._download_file(
+            "https://example.org/ref.fasta", dest, compute_sha256=True
+        )
+
+        assert ok
+        assert checksum == hashlib.sha256(FASTA).hexdigest()
+        assert checksum == manager._compute_checksum(dest)
+
+    def test_download_decodes_gzip_transfer(self, manager, tmp_path, monkeypatch):
+        def handler(request):
+            assert "gzip" in request.headers["Accept-Encoding"]
+            return httpx.Response(
+                200, content=gzip.compress(FASTA), headers={"Content-Encoding": "gzip"}
+            )
+
+        client = httpx.Client(
+            transport=httpx.MockTransport(handler),
+            headers=reference_manager._http_client().headers,
+        )
+        monkeypatch.setattr(reference_manager, "_http_client", lambda: client)
+        dest = tmp_path / "ref.fasta"
+
+        ok, checksum, _ = manager._download_file(
+            "https://example.org/ref.fasta", dest, compute_sha256=True
+        )
+
+        assert ok
+        assert dest.read_bytes() == FASTA
+        assert checksum == hashlib.sha256(FASTA).hexdigest()
+
+    def test_download_not_modified(self, manager, tmp_path, monkeypatch):
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=FASTA, headers={"ETag": '"v1"'})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(reference_manager, "_http_client", lambda: client)
+        dest = tmp_path / "ref.fasta"
+
+        assert manager._download_file("https://example.org/ref.fasta", dest) == (True, None, '"v1"')
+        dest.write_bytes(b"local copy")
+
+        ok, checksum, etag = manager._download_file(
+            "https://example.org/ref.fasta", dest, compute_sha256=True, etag='"v1"'
+        )
+
+        assert (ok, checksum, etag) == (True, None, '"v1"')
+        assert dest.read_bytes() == b"local copy"
+
+    def test_download_resumes_partial(self, manager, tmp_path, monkeypatch):
+        def handler(request):
+            assert request.headers["Range"] == "bytes=10-"
+            assert request.headers["If-Range"] == '"v1"'
+            return httpx.Response(206, content=FASTA[10:], headers={"ETag": '"v1"'})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(reference_manager, "_http_client", lambda: client)
+        dest = tmp_path / "ref.fasta"
+        (tmp_path / "ref.fasta.part").write_bytes(FASTA[:10])
+        (tmp_path / "ref.fasta.part.etag").write_text('"v1"')
+
+        ok, checksum, _ = manager._download_file(
+            "https://example.org/ref.fasta", dest, compute_sha256=True
+        )
+
+        assert ok
+        assert dest.read_bytes() == FASTA
+        assert checksum == hashlib.sha256(FASTA).hexdigest()
+        assert not (tmp_path / "ref.fasta.part").exists()
+        assert not (tmp_path / "ref.fasta.part.etag").exists()
+
+    def test_download_restarts_after_416(self, manager, tmp_path, monkeypatch):
+        closed = []
+
+        class Body(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b""
+
+            def close(self):
+                closed.append(True)
+
+        def handler(request):
+            if "Range" in request.headers:
+                return httpx.Response(416, stream=Body())
+            # The 416 response is closed before the retry is sent
+            assert closed
+            return httpx.Response(200, content=FASTA)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(reference_manager, "_http_client", lambda: client)
+        dest = tmp_path / "ref.fasta"
+        (tmp_path / "ref.fasta.part").write_bytes(FASTA)
+        (tmp_path / "ref.fasta.part.etag").write_text('"v1"')
+
+        ok, checksum, _ = manager._download_file(
+            "https://example.org/ref.fasta", dest, compute_sha256=True
+        )
+
+        assert ok
+        assert dest.read_bytes() == FASTA
+        assert checksum == hashlib.sha256(FASTA).hexdigest()
+
+    async def test_bootstrap_async(self, manager, mock_http):
+        url = reference_manager.REFERENCE_SOURCES["rsv"]["url"]
+        mock_http[url] = FASTA
+
+        info = await manager.bootstrap_reference_async("rsv")
+
+        assert info.status == reference_manager.DatabaseStatus.INSTALLED
+        assert info.checksum == hashlib.sha256(FASTA).hexdigest()
+        assert manager.manifest["databases"]["rsv"]["length"] == 16
+
+    def test_rebootstrap_not_modified_skips_rehash(self, manager, monkeypatch):
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=FASTA, headers={"ETag": '"v1"'})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(reference_manager, "_http_client", lambda: client)
+        first = manager.bootstrap_reference("rsv")
+
+        def fail(_path):
+            raise AssertionError("unchanged reference was re-read")
+
+        monkeypatch.setattr(manager, "_compute_checksum", fail)
+        monkeypatch.setattr(reference_manager, "_fasta_sequence_length", fail)
+        second = manager.bootstrap_reference("rsv")
+
+        assert second.checksum == first.checksum
+        assert manager.manifest["databases"]["rsv"]["length"] == 16
+
+    def test_bootstrap_all(self, manager, mock_http):
+        mock_http[reference_manager.REFERENCE_SOURCES["sars-cov-2"]["url"]] = FASTA
+        for scheme in reference_manager.PRIMER_SCHEMES.values():
+            mock_http[scheme["url"]] = b"MN908947.3\t30\t54\tnCoV_1_LEFT\t1\t+\n"
+
+        results = manager.bootstrap_all()
+
+        assert results["success"], results["errors"]
+        saved = json.loads(manager.manifest_path.read_text())
+        assert set(saved["primers"]) == set(reference_manager.PRIMER_SCHEMES)
+        assert "sars-cov-2" in saved["databases"]
+
+    def test_ranged_download(self, manager, tmp_path, monkeypatch):
+        body = FASTA * 10
+        ranges = []
+
+        def handler(request):
+            headers = {"Accept-Ranges": "bytes", "ETag": '"v1"'}
+            if request.method == "HEAD":
+                return httpx.Response(200, headers={**headers, "Content-Length": str(len(body))})
+            start, end = map(int, request.headers["Range"].removeprefix("bytes=").split("-"))
+            ranges.append((start, end))
+            return httpx.Response(206, content=body[start:end + 1], headers=headers)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(reference_manager, "_http_client", lambda: client)
+        monkeypatch.setattr(reference_manager, "RANGED_DOWNLOAD_MIN_SIZE", 1)
+        dest = tmp_path / "ref.fasta"
+
+        ok, checksum, etag = manager._download_file_ranged(
+            "https://example.org/ref.fasta", dest, compute_sha256=True, n_parts=3
+        )
+
+        assert (ok, etag) == (True, '"v1"')
+        assert len(ranges) == 3
+        assert dest.read_bytes() == body
+        assert checksum == hashlib.sha256(body).hexdigest()
+        assert not list(tmp_path.glob("ref.fasta.*"))
+
+    def test_download_decompresses_gzip_payload(self, manager, mock_http, tmp_path):
+        # Two gzip members split across arbitrary chunk boundaries
+        mock_http["https://example.org/ref.fasta.gz"] = (
+            gzip.compress(FASTA[:20]) + gzip.compress(FASTA[20:])
+        )
+        dest = tmp_path / "ref.fasta"
+
+        ok, checksum, _ = manager._download_file(
+            "https://example.org/ref.fasta.gz", dest, compute_sha256=True, decompress_gzip=True
+        )
+
+        assert ok
+        assert dest.read_bytes() == FASTA
+        assert checksum == hashlib.sha256(FASTA).hexdigest()
+
+    def test_download_truncated_gzip_fails(self, manager, mock_http, tmp_path):
+        mock_http["https://example.org/ref.fasta.gz"] = gzip.compress(FASTA)[:-8]
+        dest = tmp_path / "ref.fasta"
+
+        ok, _, _ = manager._download_file(
+            "https://example.org/ref.fasta.gz", dest, decompress_gzip=True
+        )
+
+        assert not ok
+        assert not dest.exists()
+
+    @pytest.mark.usefixtures("mock_http")
+    def test_download_http_error(self, manager, tmp_path):
+        dest = tmp_path / "missing.fasta"
+
+        ok, checksum, _ = manager._download_file("https://example.org/missing.fasta", dest)
+
+        assert not ok
+        assert checksum is None
+
+
+class TestChecksum:
+    """Tests for file checksums."""
+
+    def test_checksum_matches_hashlib(self, manager, tmp_path):
+        path = tmp_path / "ref.fasta"
+        path.write_bytes(FASTA)
+
+        assert manager._compute_checksum(path) == hashlib.sha256(FASTA).hexdigest()
+
+    def test_checksum_chunked_path(self, manager, tmp_path, monkeypatch):
+        monkeypatch.setattr(reference_manager, "MMAP_CHECKSUM_LIMIT", 0)
+        monkeypatch.setattr(reference_manager, "CHECKSUM_CHUNK_SIZE", 7)
+        path = tmp_path / "ref.fasta"
+        path.write_bytes(FASTA)
+
+        assert manager._compute_checksum(path) == hashlib.sha256(FASTA).hexdigest()
+
+    def test_checksum_empty_file(self, manager, tmp_path):
+        path = tmp_path / "empty.bed"
+        path.write_bytes(b"")
+
+        assert manager._compute_checksum(path) == hashlib.sha256(b"").hexdigest()
+
+
+class TestVerifyIntegrity:
+    """Tests for integrity verification."""
+
+    def _install(self, manager, ref_id, content):
+        path = manager.references_dir / ref_id / "reference.fasta"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        manager.manifest["databases"][ref_id] = {
+            "checksum": hashlib.sha256(content).hexdigest(),
+            "path": str(path),
+        }
+        return path
+
+    def test_valid_databases(self, manager):
+        self._install(manager, "sars-cov-2", FASTA)
+        self._install(manager, "rsv", b">rsv\nACGT\n")
+
+        assert manager.verify_integrity() == {"valid": True, "issues": []}
+
+    def test_detects_mismatch_and_missing(self, manager):
+        self._install(manager, "sars-cov-2", FASTA).write_bytes(b">tampered\n")
+        self._install(manager, "rsv", b">rsv\nACGT\n").unlink()
+
+        results = manager.verify_integrity()
+
+        assert not results["valid"]
+        assert "Checksum mismatch: sars-cov-2" in results["issues"]
+        assert any(issue.startswith("Missing file:") for issue in results["issues"])
+
+    def test_detects_modified_primer(self, manager):
+        bed = manager.references_dir / "primers" / "ARTIC-V3.bed"
+        bed.parent.mkdir(parents=True)
+        bed.write_bytes(b"original\n")
+        manager.manifest["primers"]["ARTIC-V3"] = {
+            "checksum": hashlib.sha256(b"original\n").hexdigest(),
+            "path": str(bed),
+        }
+        assert manager.verify_integrity()["valid"]
+
+        bed.write_bytes(b"modified\n")
+
+        assert manager.verify_integrity()["issues"] == ["Checksum mismatch: ARTIC-V3"]
+
+    def test_unchanged_files_skip_hashing(self, manager):
+        path = self._install(manager, "sars-cov-2", FASTA)
+        manager.manifest["databases"]["sars-cov-2"].update(
+            reference_manager._stat_fingerprint(path)
+        )
+        manager.manifest["databases"]["sars-cov-2"]["checksum"] = "stale"
+
+        assert manager.verify_integrity()["valid"]
+        assert not manager.verify_integrity(deep=True)["valid"]
+
+
+class TestCaching:
+    """Tests for manifest and inventory caching."""
+
+    def test_manifest_shared_between_instances(self, manager):
+        manager.manifest["databases"]["rsv"] = {"checksum": "abc", "path": "/x"}
+        manager._save_manifest()
+
+        other = ReferenceManager(references_dir=manager.references_dir)
+
+        assert other.manifest == manager.manifest
+        assert other.manifest is not manager.manifest
+
+    def test_unsaved_changes_do_not_leak(self, manager):
+        manager._save_manifest()
+        manager.manifest["databases"]["rsv"] = {"checksum": "abc"}
+
+        other = ReferenceManager(references_dir=manager.references_dir)
+
+        assert "rsv" not in other.manifest["databases"]
+
+    def test_manifest_reloaded_after_external_change(self, manager):
+        manager._save_manifest()
+        manager.manifest_path.write_text('{"databases": {"rsv": {}}, "primers": {}}')
+
+        other = ReferenceManager(references_dir=manager.references_dir)
+
+        assert "rsv" in other.manifest["databases"]
+
+    def test_inventory_lists_installed_primers(self, manager):
+        primers = manager.references_dir / "primers"
+        primers.mkdir()
+        (primers / "ARTIC-V4.1.bed").write_text("")
+
+        inventory = manager.get_inventory()
+
+        assert inventory["primers"]["ARTIC-V4.1"]["status"] == "installed"
+        assert inventory["primers"]["ARTIC-V4.1"]["path"] == str(primers / "ARTIC-V4.1.bed")
+        assert inventory["primers"]["ARTIC-V3"]["status"] == "not_installed"
+
+    def test_cached_inventory_is_a_copy(self, manager):
+        manager.get_inventory()["missing_critical"].clear()
+
+        assert "sars-cov-2" in manager.get_inventory()["missing_critical"]
+
+    def test_transaction_defers_write(self, manager):
+        with manager._manifest_transaction():
+            manager.manifest["databases"]["rsv"] = {"checksum": "abc"}
+            manager._save_manifest()
+            assert not manager.manifest_path.exists()
+
+        assert "rsv" in json.loads(manager.manifest_path.read_text())["databases"]
+        assert not manager.manifest_path.with_suffix(".json.tmp").exists()
+
+    def test_inventory_invalidated_on_save(self, manager):
+        assert "sars-cov-2" in manager.get_inventory()["missing_critical"]
+
+        fasta = manager.references_dir / "sars-cov-2" / "reference.fasta"
+        fasta.parent.mkdir(parents=True)
+        fasta.write_bytes(FASTA)
+        assert "sars-cov-2" in manager.get_inventory()["missing_critical"]
+
+        manager._save_manifest()
+        inventory = manager.get_inventory()
+
+        assert inventory["references"]["sars-cov-2"]["status"] == "installed"
+
+
+class TestPrimerPath:
+    """Tests for primer scheme resolution."""
+
+    @pytest.fixture
+    def primers_dir(self, manager):
+        primers = manager.references_dir / "primers"
+        primers.mkdir()
+        for scheme_id in reference_manager.PRIMER_SCHEMES:
+            (primers / f"{scheme_id}.bed").write_text("MN908947.3\t30\t54\tnCoV_1_LEFT\t1\t+\n")
+        return primers
+
+    @pytest.mark.parametrize(
+        "scheme,expected",
+        [
+            ("ARTIC-V3", "ARTIC-V3"),
+            ("ARTIC_v3", "ARTIC-V3"),
+            ("artic v4", "ARTIC-V4"),
+            ("  Artic__V4.1 ", "ARTIC-V4.1"),
+            ("v4.1", "ARTIC-V4.1"),
+            ("5.3.2", "ARTIC-V5.3.2"),
+        ],
+    )
+    def test_aliases(self, manager, primers_dir, scheme, expected):
+        assert manager.get_primer_path(scheme) == primers_dir / f"{expected}.bed"
+
+    def test_custom_scheme(self, manager, primers_dir):
+        (primers_dir / "midnight.bed").write_text("")
+
+        assert manager.get_primer_path("midnight") == primers_dir / "midnight.bed"
+
+    @pytest.mark.usefixtures("primers_dir")
+    def test_missing_scheme(self, manager):
+        assert manager.get_primer_path("ARTIC-V9") is None
+
+
+class TestFastaLength:
+    """Tests for reference length validation."""
+
+    def test_multi_record_length(self, tmp_path):
+        path = tmp_path / "multi.fasta"
+        path.write_bytes(FASTA + b">seg2\r\nACG\r\n\n")
+
+        assert reference_manager._fasta_sequence_length(path) == 19
@@ -2,15 +2,23 @@
 Tests for pre-flight validation module.
 """
 
+import gzip
+import hashlib
+from datetime import datetime
+
+import orjson
 import pytest
 from pathlib import Path
 
+from vgap.validators import preflight
 from vgap.validators.preflight import (
     FASTQValidator,
     PairedReadValidator,
     MetadataValidator,
     AmpliconValidator,
     PreflightValidator,
+    ReferenceValidator,
+    ValidationContext,
     ValidationStatus,
     ValidationErrorCode,
 )
@@ -54,6 +62,29 @@ class TestFASTQValidator:
         validator = FASTQValidator()
         result = validator.validate_fastq_format(invalid)
         assert result.blocked
+
+    def test_length_mismatch_reports_first_bad_record(self, tmp_path):
+        path = tmp_path / "mismatch.fastq"
+        path.write_bytes(
+            b"@read1\nATCG\n+\nIIII\n@read2\nATC\n+\nIIII\n@read3\nA\n+\n"
+        )
+
+        validator = FASTQValidator()
+        result = validator.validate_fastq_format(path)
+        assert result.blocked
+        assert "line 6: 3 vs 4" in result.errors[0].message
+        assert result.metadata["read_count_sampled"] == 1
+
+    def test_validate_gzipped_fastq_format(self, tmp_path):
+        path = tmp_path / "reads.fastq.gz"
+        with gzip.open(path, "wb") as f:
+            f.write(b"@read1\nATCG\n+\nIIII\n@read2\nATCGA\n+\nIIIII\n")
+        
+        validator = FASTQValidator()
+        result = validator.validate_fastq_format(path)
+        assert result.passed
+        assert result.metadata["read_length_min"] == 4
+        assert result.metadata["read_length_max"] == 5
     
     def test_validate_empty_file(self, tmp_path):
         empty = tmp_path / "empty.fastq"
@@ -63,11 +94,154 @@ class TestFASTQValidator:
         result = validator.validate_file_size(empty)
         assert result.blocked
         assert result.errors[0].code == ValidationErrorCode.FASTQ_EMPTY_FILE
+    
+    def test_gzip_integrity_reads_trailer(self, tmp_path):
+        data = b"@read1\nATCG\n+\nIIII\n"
+        path = tmp_path / "reads.fastq.gz"
+        path.write_bytes(gzip.compress(data))
+        short = tmp_path / "short.fastq.gz"
+        short.write_bytes(gzip.compress(data)[:12])
+        
+        validator = FASTQValidator()
+        result = validator.validate_gzip_integrity(path)
+        assert result.passed
+        assert result.metadata["gzip_isize"] == len(data)
+        assert validator.validate_gzip_integrity(short).blocked
+    
+    def test_gzip_detected_by_content(self, tmp_path):
+        misnamed = tmp_path / "reads.fastq"
+        misnamed.write_bytes(gzip.compress(b"@read1\nATCG\n+\nIIII\n"))
+        
+        validator = FASTQValidator()
+        result = validator.validate_file(misnamed)
+        assert result.passed
+        assert result.metadata["gzipped"] is True
+        assert result.metadata["read_count_sampled"] == 1
+    
+    def test_fast_integrity_check_multi_member(self, tmp_path):
+        path = tmp_path / "reads.fastq.gz"
+        path.write_bytes(
+            gzip.compress(b"@read1\nATCG\n+\nIIII\n")
+            + gzip.compress(b"@read2\nATCG\n+\nIIII\n")
+        )
+        
+        validator = FASTQValidator()
+        result = validator.validate_gzip_integrity(path, fast_integrity_check=True)
+        assert result.passed
+    
+    def test_fast_integrity_check_detects_corruption(self, tmp_path):
+        data = bytearray(gzip.compress(b"@read1\nATCG\n+\nIIII\n" * 100))
+        data[-8] ^= 0xFF  # Flip a CRC32 trailer byte
+        corrupt = tmp_path / "corrupt.fastq.gz"
+        corrupt.write_bytes(bytes(data))
+        truncated = tmp_path / "truncated.fastq.gz"
+        truncated.write_bytes(bytes(data[:len(data) // 2]))
+        
+        validator = FASTQValidator()
+        for path in (corrupt, truncated):
+            result = validator.validate_gzip_integrity(path, fast_integrity_check=True)
+            assert result.blocked
+            assert result.errors[0].code == ValidationErrorCode.FASTQ_CORRUPT_GZIP
+    
+    def test_fast_integrity_check_uses_context_threads(self, tmp_path, mocker):
+        path = tmp_path / "reads.fastq.gz"
+        path.write_bytes(gzip.compress(b"@read1\nATCG\n+\nIIII\n"))
+        rapidgzip = mocker.patch.object(preflight, "rapidgzip", create=True)
+        rapidgzip.open.return_value.__enter__.return_value.read.return_value = b""
+        mocker.patch.object(preflight, "RAPIDGZIP_AVAILABLE", True)
+        mocker.patch.object(preflight, "RAPIDGZIP_MIN_SIZE", 0)
+
+        validator = FASTQValidator()
+        result = validator.validate_file(
+            path,
+            compute_checksum=False,
+            fast_integrity_check=True,
+            ctx=ValidationContext(decode_threads=2),
+        )
+        assert result.passed
+        assert rapidgzip.open.call_args.kwargs["parallelization"] == 2
+    
+    def test_validate_file_streaming(self, tmp_path):
+        data = gzip.compress(b"@read1\nATCG\n+\nIIII\n" * 10) + gzip.compress(
+            b"@read2\nATCGA\n+\nIIIII\n" * 10
+        )
+        path = tmp_path / "reads.fastq.gz"
+        path.write_bytes(data)
+        
+        validator = FASTQValidator()
+        result = validator.validate_file_streaming(path, num_records=15)
+        assert result.passed
+        assert result.metadata["sha256"] == hashlib.sha256(data).hexdigest()
+        assert result.metadata["read_count_sampled"] == 15
+        assert result.metadata["read_length_max"] == 5
+    
+    def test_validate_file_streaming_detects_corruption(self, tmp_path):
+        data = bytearray(gzip.compress(b"@read1\nATCG\n+\nIIII\n" * 100))
+        data[-8] ^= 0xFF  # Flip a CRC32 trailer byte
+        path = tmp_path / "reads.fastq.gz"
+        path.write_bytes(bytes(data))
+        
+        validator = FASTQValidator()
+        result = validator.validate_file_streaming(path, num_records=1)
+        assert result.blocked
+        assert result.errors[0].code == ValidationErrorCode.FASTQ_CORRUPT_GZIP
+        assert "sha256" not in result.metadata
+    
+    def test_validate_file_streaming_inflates_only_sample(self, tmp_path, mocker):
+        records = b"@read1\nATCG\n+\nIIII\n" * 1000
+        data = bytearray(gzip.compress(records))
+        data[-8] ^= 0xFF  # Corrupt CRC32 beyond the sampled records
+        path = tmp_path / "reads.fastq.gz"
+        path.write_bytes(bytes(data))
+        mocker.patch.object(preflight, "GZIP_TEST_CHUNK_SIZE", 64)
+        
+        validator = FASTQValidator()
+        result = validator.validate_file_streaming(path, num_records=2)
+        assert result.passed
+        assert result.metadata["sha256"] == hashlib.sha256(data).hexdigest()
+        assert result.metadata["gzip_isize"] == len(records)
+        
+        # The full CRC check is opt-in
+        result = validator.validate_file(path, fast_integrity_check=True)
+        assert result.blocked
+        assert result.errors[0].code == ValidationErrorCode.FASTQ_CORRUPT_GZIP
+    
+    def test_validate_files(self, sample_fastq_r1, sample_fastq_r2, tmp_path):
+        missing = tmp_path / "missing.fastq"
+        
+        validator = FASTQValidator()
+        results = validator.validate_files([sample_fastq_r1, missing, sample_fastq_r2])
+        assert [r.passed for r in results] == [True, False, True]
+        assert results[2].metadata["sha256"] == validator.compute_checksum(sample_fastq_r2)
+    
+    def test_validate_file_uses_context_stat(self, sample_fastq_r1, tmp_path):
+        missing = tmp_path / "missing.fastq"
+        ctx = ValidationContext()
+        ctx.prefetch([sample_fastq_r1, missing])
+        assert ctx.stat(missing) is None
+        
+        validator = FASTQValidator()
+        result = validator.validate_file(sample_fastq_r1, ctx=ctx)
+        assert result.passed
+        assert result.metadata["file_size_bytes"] == ctx.stat_cache[sample_fastq_r1].st_size
+        assert validator.validate_file(missing, ctx=ctx).blocked
+    
+    def test_compute_checksum(self, sample_fastq_r1):
+        validator = FASTQValidator()
+        expected = hashlib.sha256(sample_fastq_r1.read_bytes()).hexdigest()
+        assert validator.compute_checksum(sample_fastq_r1) == expected
 
 
 class TestPairedReadValidator:
     """Tests for paired-end read validation."""
     
+    def test_extract_read_id(self):
+        validator = PairedReadValidator()
+        assert validator.extract_read_id(b"@read1/1") == b"read1"
+        assert validator.extract_read_id(b"@read1 1:N:0:1") == b"read1"
+        assert validator.extract_read_id(b"@read1/3") == b"read1/3"
+        assert validator.extract_read_id("@read1/2") == "read1"
+    
     def test_validate_matching_pairs(self, sample_fastq_r1, sample_fastq_r2):
         validator = PairedReadValidator()
         result = validator.validate_pair_consistency(sample_fastq_r1, sample_fastq_r2)
@@ -84,6 +258,33 @@ class TestPairedReadValidator:
         result = validator.validate_pair_consistency(r1, r2)
         assert result.blocked
         assert result.errors[0].code == ValidationErrorCode.PAIR_ID_MISMATCH
+        assert "R1=read1, R2=read2" in result.errors[0].message
+    
+    def test_validate_r1_has_more_reads(self, tmp_path):
+        r1 = tmp_path / "R1.fastq"
+        r2 = tmp_path / "R2.fastq"
+        
+        r1.write_text("@read1/1\nATCG\n+\nIIII\n@read2/1\nATCG\n+\nIIII\n")
+        r2.write_text("@read1/2\nGCTA\n+\nIIII\n")
+        
+        validator = PairedReadValidator()
+        result = validator.validate_pair_consistency(r1, r2)
+        assert result.blocked
+        assert result.errors[0].code == ValidationErrorCode.PAIR_COUNT_MISMATCH
+        assert result.metadata["records_checked"] == 1
+
+    def test_tail_mismatch_beyond_sample(self, tmp_path):
+        r1 = tmp_path / "R1.fastq"
+        r2 = tmp_path / "R2.fastq"
+
+        r1.write_text("@read1/1\nATCG\n+\nIIII\n@read2/1\nATCG\n+\nIIII\n@read3/1\nATCG\n+\nIIII\n")
+        r2.write_text("@read1/2\nGCTA\n+\nIIII\n@read2/2\nGCTA\n+\nIIII\n@read4/2\nGCTA\n+\nIIII\n")
+
+        validator = PairedReadValidator()
+        result = validator.validate_pair_consistency(r1, r2, num_records=1)
+        assert result.blocked
+        assert result.errors[0].code == ValidationErrorCode.PAIR_ID_MISMATCH
+        assert "R1=@read3/1, R2=@read4/2" in result.errors[0].message
 
 
 class TestMetadataValidator:
@@ -113,6 +314,18 @@ class TestMetadataValidator:
         result = validator.validate_date_format("2024-01-15")
         assert result.passed
     
+    def test_impossible_date(self):
+        validator = MetadataValidator()
+        result = validator.validate_date_format("2024-02-30")
+        assert result.blocked
+        assert result.errors[0].code == ValidationErrorCode.METADATA_INVALID_DATE
+    
+    def test_future_date_relative_to_now(self):
+        validator = MetadataValidator()
+        result = validator.validate_date_format("2024-01-15", now=datetime(2024, 1, 1))
+        assert not result.blocked
+        assert result.warnings[0].code == "DATE_IN_FUTURE"
+    
     def test_invalid_protocol(self):
         validator = MetadataValidator()
         result = validator.validate_protocol("invalid_protocol")
@@ -128,12 +341,48 @@ class TestAmpliconValidator:
         assert result.passed
         assert "scheme_info" in result.metadata
     
+    def test_primer_scheme_name_normalized(self):
+        validator = AmpliconValidator()
+        for name in ("ARTIC-V4", "artic_v4", "midnight"):
+            assert validator.validate_primer_scheme_exists(name).passed
+
+    def test_normalize_scheme_name(self):
+        assert AmpliconValidator.normalize_scheme_name("  artic v4.1 ") == "ARTIC-V4.1"
+        assert AmpliconValidator.normalize_scheme_name("Artic__V4") == "ARTIC-V4"
+
+    def test_primer_scheme_in_schemes_dir(self, tmp_path):
+        (tmp_path / "custom.bed").write_text("MN908947.3\t30\t54\tp1_LEFT\t1\t+\n")
+
+        validator = AmpliconValidator(schemes_dir=tmp_path)
+        assert validator.validate_primer_scheme_exists("custom").passed
+        result = validator.validate_primer_scheme_exists("other")
+        assert result.errors[0].code == ValidationErrorCode.PRIMER_SCHEME_NOT_FOUND
+    
     def test_unknown_primer_scheme(self):
         validator = AmpliconValidator()
         result = validator.validate_primer_scheme_exists("UNKNOWN_SCHEME")
         assert result.blocked
         assert result.errors[0].code == ValidationErrorCode.PRIMER_SCHEME_NOT_FOUND
     
+    def test_validate_bed_format(self, tmp_path):
+        bed = tmp_path / "scheme.bed"
+        bed.write_text(
+            "# primers\n"
+            "MN908947.3\t30\t54\tnCoV_1_LEFT\t1\t+\n"
+            "MN908947.3\t385\t410\tnCoV_1_RIGHT\t1\t-\n"
+        )
+        empty = tmp_path / "empty.bed"
+        empty.touch()
+        invalid = tmp_path / "invalid.bed"
+        invalid.write_text("MN908947.3\tstart\t54\tnCoV_1_LEFT\t1\t+\n")
+        
+        validator = AmpliconValidator()
+        assert validator.validate_bed_format(bed).metadata["primer_count"] == 3
+        assert validator.validate_bed_format(empty).passed
+        result = validator.validate_bed_format(invalid)
+        assert result.blocked
+        assert result.errors[0].code == ValidationErrorCode.PRIMER_SCHEME_INVALID
+    
     def test_sufficient_overlap(self):
         validator = AmpliconValidator()
         result = validator.validate_overlap_sufficiency(
@@ -152,6 +401,37 @@ class TestAmpliconValidator:
         assert result.errors[0].code == ValidationErrorCode.INSUFFICIENT_OVERLAP
 
 
+class TestReferenceValidator:
+    """Tests for reference and database checks."""
+    
+    def test_reference_exists(self, tmp_path):
+        reference = tmp_path / "reference.fasta"
+        reference.write_text(">ref\nACGT\n")
+        
+        validator = ReferenceValidator()
+        assert validator.validate_reference_exists(reference).passed
+        result = validator.validate_reference_exists(tmp_path / "missing.fasta")
+        assert result.blocked
+        assert result.errors[0].code == ValidationErrorCode.REFERENCE_NOT_FOUND
+    
+    def test_database_exists(self, tmp_path):
+        validator = ReferenceValidator()
+        assert validator.validate_database_exists("lineage", tmp_path).passed
+        result = validator.validate_database_exists("lineage", tmp_path / "missing")
+        assert result.errors[0].code == ValidationErrorCode.DATABASE_NOT_FOUND
+
+
+    def test_reference_uses_context_stat(self, tmp_path):
+        reference = tmp_path / "reference.fasta"
+        ctx = ValidationContext()
+        ctx.prefetch([reference])
+        reference.write_text(">ref\nACGT\n")
+
+        validator = ReferenceValidator()
+        assert validator.validate_reference_exists(reference, ctx=ctx).blocked
+        assert validator.validate_reference_exists(reference).passed
+
+
 class TestPreflightValidator:
     """Integration tests for complete pre-flight validation."""
     
@@ -178,5 +458,83 @@ class TestPreflightValidator:
             mode="amplicon",
             primer_scheme=None,  # Missing!
         )
+
+        assert result.blocked
+
+    def test_fast_fail_skips_fastq_reads(self, sample_fastq_r1, sample_metadata, mocker):
+        validator = PreflightValidator()
+        read = mocker.spy(validator.fastq_validator, "validate_file")
+        metadata = {k: v for k, v in sample_metadata.items() if k != "batch_id"}
+
+        result = validator.validate_sample(sample_fastq_r1, None, metadata, mode="shotgun")
+        assert result.blocked
+        assert read.call_count == 0
+
+        result = validator.validate_sample(
+            sample_fastq_r1, None, metadata, mode="shotgun", fast_fail=False
+        )
+        assert result.blocked
+        assert read.call_count == 1
+
+    def test_full_gzip_check_is_opt_in(self, sample_fastq_r1, sample_metadata, tmp_path, mocker):
+        path = tmp_path / "sample_R1.fastq.gz"
+        path.write_bytes(gzip.compress(sample_fastq_r1.read_bytes()))
+        spy = mocker.spy(FASTQValidator, "validate_gzip_integrity")
+        
+        for full_gzip_check, calls in ((False, 0), (True, 1)):
+            validator = PreflightValidator(full_gzip_check=full_gzip_check)
+            result = validator.validate_sample(path, None, sample_metadata, mode="shotgun")
+            assert not result.blocked
+            assert spy.call_count == calls
+        assert spy.call_args.kwargs["fast_integrity_check"] is True
+    
+    def test_to_json_bytes_matches_to_dict(self, sample_fastq_r1, sample_metadata):
+        validator = PreflightValidator()
         
+        result = validator.validate_sample(
+            r1_path=sample_fastq_r1,
+            r2_path=None,
+            metadata=sample_metadata,
+            mode="amplicon",
+            primer_scheme=None,
+        )
+        
+        assert orjson.loads(result.to_json_bytes()) == result.to_dict()
+    
+    def test_validate_run_keeps_sample_order(self, sample_fastq_r1, sample_metadata, tmp_path):
+        validator = PreflightValidator()
+        samples = [
+            {"r1_path": str(sample_fastq_r1), "metadata": dict(sample_metadata, sample_id=f"S{i}")}
+            for i in range(4)
+        ]
+        samples[2]["r1_path"] = str(tmp_path / "missing.fastq")
+        
+        result = validator.validate_run(samples=samples, mode="shotgun")
+        
+        validations = result.metadata["sample_validations"]
+        assert [v["metadata"]["sample_id"] for v in validations] == ["S0", "S1", "S2", "S3"]
+        assert [v["status"] for v in validations].count("fail") == 1
+        assert validations[2]["status"] == "fail"
         assert result.blocked
+
+    def test_validate_run_without_details(self, sample_fastq_r1, sample_metadata):
+        validator = PreflightValidator()
+        samples = [{"r1_path": str(sample_fastq_r1), "metadata": sample_metadata}]
+
+        result = validator.validate_run(samples=samples, mode="shotgun", collect_details=False)
+
+        assert result.metadata["sample_validations"] is None
+        assert result.metadata["summary"]["passed"] + result.metadata["summary"]["warnings"] == 1
+
+    def test_primer_scheme_checked_once_per_run(self, sample_fastq_r1, sample_metadata, mocker):
+        validator = PreflightValidator()
+        check = mocker.spy(validator.amplicon_validator, "validate_primer_scheme_exists")
+        samples = [
+            {"r1_path": str(sample_fastq_r1), "metadata": dict(sample_metadata, sample_id=f"S{i}")}
+            for i in range(3)
+        ]
+        
+        result = validator.validate_run(samples=samples, mode="amplicon", primer_scheme="ARTIC_v4")
+        
+        assert result.metadata["summary"]["failed"] == 0
+        assert check.call_count == 1
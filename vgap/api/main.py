@@ -73,7 +73,7 @@ async def lifespan(app: FastAPI):
                 missing=inventory["missing_critical"]
             )
             logger.info("Auto-bootstrapping reference databases...")
-            result = ref_manager.bootstrap_all()
+            result = await ref_manager.bootstrap_all_async()
             if result["success"]:
                 logger.info("Reference databases bootstrapped successfully")
             else:
@@ -156,7 +156,7 @@ async def bootstrap_databases(
     from vgap.services.reference_manager import ReferenceManager
     
     manager = ReferenceManager()
-    result = manager.bootstrap_all()
+    result = await manager.bootstrap_all_async()
     
     return {
         "success": result["success"],
@@ -185,7 +185,7 @@ async def bootstrap_single_database(
             detail=f"Unknown reference ID: {ref_id}"
         )
     
-    result = manager.bootstrap_reference(ref_id)
+    result = await manager.bootstrap_reference_async(ref_id)
     
     if result.status == DatabaseStatus.ERROR:
         raise HTTPException(
@@ -202,6 +202,7 @@ async def bootstrap_single_database(
 
 @router.get("/databases/verify")
 async def verify_database_integrity(
+    deep: bool = Query(False, description="Re-hash files even if size/mtime are unchanged"),
     current_user: User = Depends(require_admin),
 ):
     """
@@ -212,7 +213,7 @@ async def verify_database_integrity(
     from vgap.services.reference_manager import ReferenceManager
     
     manager = ReferenceManager()
-    return manager.verify_integrity()
+    return manager.verify_integrity(deep=deep)
 
 
 @router.post("/databases/{name}/update", response_model=DatabaseUpdateResponse)
@@ -121,6 +121,9 @@ async def login_for_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Persist last_login (and any upgraded password hash)
+    await session.commit()
+    
     access_token = create_access_token(
         data={
             "sub": str(user.id),
@@ -154,6 +157,9 @@ async def login(
             detail="Incorrect email or password"
         )
     
+    # Persist last_login (and any upgraded password hash)
+    await session.commit()
+    
     access_token = create_access_token(
         data={
             "sub": str(user.id),
@@ -4,6 +4,7 @@ VGAP Run Management Routes
 Database-backed run creation, monitoring, and management.
 """
 
+import base64
 from datetime import datetime
 from pathlib import Path
 from typing import Annotated, Optional
@@ -23,9 +24,8 @@ from vgap.api.schemas.parameters import RunParameters
 from vgap.models import User, Run, RunStatus
 from vgap.services.database import get_session
 from vgap.services.run_service import (
-    create_run, add_sample_to_run, get_run_by_id, list_runs,
+    create_run, add_samples_bulk, get_run_by_id, list_runs,
     update_run_status, cancel_run, start_run, get_run_samples,
-    get_run_sample_count,
 )
 from vgap.services.upload import UploadService
 from vgap.validators.preflight import PreflightValidator
@@ -34,6 +34,19 @@ router = APIRouter()
 settings = get_settings()
 
 
+def _encode_cursor(run: Run) -> str:
+    """Opaque, URL-safe keyset cursor for the page after run."""
+    raw = f"{run.created_at.isoformat()}|{run.id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Inverse of _encode_cursor; raises ValueError for a malformed cursor."""
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    created_at, _, run_id = raw.partition("|")
+    return datetime.fromisoformat(created_at), UUID(run_id)
+
+
 def run_to_response(run: Run, sample_count: int = 0) -> RunResponse:
     """Convert Run model to response schema."""
     return RunResponse(
@@ -75,14 +88,17 @@ async def create_new_run(
             )
         # D2 FIX: Validate primer scheme exists in allowed list
         from vgap.validators.preflight import AmpliconValidator
-        if run_data.primer_scheme not in AmpliconValidator.KNOWN_SCHEMES:
+        scheme_key = AmpliconValidator.normalize_scheme_name(run_data.primer_scheme)
+        if scheme_key not in AmpliconValidator.KNOWN_SCHEMES:
             allowed_schemes = [s for s in AmpliconValidator.KNOWN_SCHEMES.keys() 
-                              if s.startswith("ARTIC-")]  # Show only standard hyphenated names
+                              if s.startswith("ARTIC-")]  # Show only ARTIC schemes
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid primer scheme '{run_data.primer_scheme}'. "
                        f"Allowed schemes: {', '.join(sorted(allowed_schemes))}"
             )
+        # Store the canonical name; the pipeline builds the BED path from it
+        run_data.primer_scheme = scheme_key
     elif run_data.mode == PipelineMode.SHOTGUN:
         # Shotgun mode should not have primer scheme (or null)
         if run_data.primer_scheme and run_data.primer_scheme != "null":
@@ -118,6 +134,7 @@ async def create_new_run(
             )
             
     # Add samples
+    sample_rows = []
     for sample_data in run_data.samples:
         # Get file paths from upload session
         r1_path = str(upload_service.get_file_path(
@@ -129,14 +146,14 @@ async def create_new_run(
                 str(run.id), sample_data.r2_filename
             ))
         
-        await add_sample_to_run(
-            session=session,
-            run_id=run.id,
-            sample_id=sample_data.metadata.sample_id,
-            metadata=sample_data.metadata.model_dump(),
-            r1_path=r1_path,
-            r2_path=r2_path,
-        )
+        sample_rows.append({
+            "sample_id": sample_data.metadata.sample_id,
+            "metadata": sample_data.metadata.model_dump(),
+            "r1_path": r1_path,
+            "r2_path": r2_path,
+        })
+    
+    await add_samples_bulk(session, run.id, sample_rows)
     
     await session.commit()
     
@@ -150,13 +167,17 @@ async def list_all_runs(
     status_filter: Optional[str] = Query(None, description="Filter by status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ):
     """
     List runs visible to the current user.
     
-    Analysts see only their runs. Admins see all runs.
+    Analysts see only their runs. Admins see all runs. Pass the returned
+    next_cursor to fetch the following page without an OFFSET scan; skip
+    cannot be combined with a cursor. With a cursor, total counts the runs
+    from the cursor onward rather than every matching run.
     """
     # Filter by user unless admin
     user_id = None if current_user.role.value == "admin" else current_user.id
@@ -172,25 +193,42 @@ async def list_all_runs(
                 detail=f"Invalid status: {status_filter}"
             )
     
+    after = None
+    if cursor:
+        if skip:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="skip cannot be combined with cursor"
+            )
+        try:
+            after = _decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid cursor: {cursor}"
+            )
+    
     runs, total = await list_runs(
         session=session,
         user_id=user_id,
         status_filter=status_enum,
         skip=skip,
         limit=limit,
+        after=after,
     )
     
-    # Get sample counts
-    items = []
-    for run in runs:
-        count = await get_run_sample_count(session, run.id)
-        items.append(run_to_response(run, count))
+    items = [run_to_response(run, run.sample_count) for run in runs]
+    
+    next_cursor = None
+    if len(runs) == limit:
+        next_cursor = _encode_cursor(runs[-1])
     
     return RunListResponse(
         items=items,
         total=total,
         skip=skip,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -216,7 +254,8 @@ async def get_run_details(
             detail="Access denied"
         )
     
-    sample_count = await get_run_sample_count(session, run_id)
+    # Samples are already loaded, so count them without another query
+    sample_count = len(run.samples)
     
     # Calculate variant counts for response
     for sample in run.samples:
@@ -302,7 +341,8 @@ async def start_run_processing(
         )
     
     validator = PreflightValidator(
-        references_dir=Path(settings.storage.references_dir)
+        references_dir=Path(settings.storage.references_dir),
+        full_gzip_check=settings.pipeline.preflight_full_gzip_check,
     )
     validation_samples = []
     for sample in samples:
@@ -331,6 +371,7 @@ async def start_run_processing(
         mode=run.mode,
         primer_scheme=run.primer_scheme,
         reference_path=reference_path,
+        collect_details=False,
     )
     
     if result.blocked:
@@ -423,7 +464,9 @@ async def validate_run(
     
     samples = await get_run_samples(session, run_id)
     
-    validator = PreflightValidator()
+    validator = PreflightValidator(
+        full_gzip_check=settings.pipeline.preflight_full_gzip_check
+    )
     validation_samples = []
     for sample in samples:
         validation_samples.append({
@@ -436,6 +479,7 @@ async def validate_run(
         samples=validation_samples,
         mode=run.mode,
         primer_scheme=run.primer_scheme,
+        collect_details=False,
     )
     
     return ValidationResultResponse(
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException, status
 from fastapi.responses import JSONResponse
-from vgap.services.upload import UploadService
+from vgap.services.upload import CHECKSUM_SIDECAR, UploadService
 
 router = APIRouter(tags=["Upload"])
 
@@ -100,7 +100,7 @@ async def get_upload_status(session_id: str):
     Returns all files in the session and their status.
     """
     upload_service = UploadService()
-    session_dir = upload_service.upload_dir / session_id
+    session_dir = upload_service.session_path(session_id)
     
     if not session_dir.exists():
         return JSONResponse(
@@ -116,7 +116,7 @@ async def get_upload_status(session_id: str):
     
     files = []
     for path in session_dir.iterdir():
-        if path.is_file():
+        if path.is_file() and path.name != CHECKSUM_SIDECAR:
             files.append({
                 "filename": path.name,
                 "size": path.stat().st_size,
@@ -430,6 +430,7 @@ class SampleListResponse(PaginatedResponse):
 class RunListResponse(PaginatedResponse):
     """Paginated list of runs."""
     items: list[RunResponse]
+    next_cursor: Optional[str] = None
 
 
 class UserListResponse(PaginatedResponse):
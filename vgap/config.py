@@ -99,6 +99,10 @@ class SecuritySettings(BaseSettings):
     jwt_algorithm: str = Field(default="HS256")
     jwt_expire_minutes: int = Field(default=60 * 24, ge=5)  # 24 hours
     bcrypt_rounds: int = Field(default=12, ge=4, le=31)
+    # Argon2id cost for new password hashes; tune to ~100 ms per verify
+    argon2_time_cost: int = Field(default=3, ge=1)
+    argon2_memory_cost: int = Field(default=65536, ge=8)  # KiB
+    argon2_parallelism: int = Field(default=4, ge=1)
     cors_origins: list[str] = Field(
         default=["http://localhost:3000", "http://localhost:8080"]
     )
@@ -162,6 +166,10 @@ class PipelineSettings(BaseSettings):
     # Contamination thresholds
     negative_control_threshold: float = Field(default=0.001, ge=0.0, le=0.1)
     
+    # Pre-flight: inflate whole gzipped FASTQs to verify CRCs (slow; faster
+    # with the fastgz extra)
+    preflight_full_gzip_check: bool = Field(default=False)
+    
     # Coverage thresholds for reporting
     coverage_thresholds: list[int] = Field(default=[1, 10, 30, 100])
 
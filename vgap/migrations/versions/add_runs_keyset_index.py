@@ -0,0 +1,29 @@
+"""add_runs_keyset_index
+
+Revision ID: add_runs_keyset_index
+Revises: add_run_parameters
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_runs_keyset_index'
+down_revision: Union[str, None] = 'add_run_parameters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_runs_user_status_created',
+        'runs',
+        ['user_id', 'status', sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_runs_user_status_created', table_name='runs')
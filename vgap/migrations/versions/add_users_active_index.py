@@ -0,0 +1,30 @@
+"""add_users_active_index
+
+Revision ID: add_users_active_index
+Revises: add_runs_keyset_index
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_users_active_index'
+down_revision: Union[str, None] = 'add_runs_keyset_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_users_active_created',
+        'users',
+        [sa.text('created_at DESC')],
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_active_created', table_name='users')
@@ -21,9 +21,12 @@ from sqlalchemy import (
     String,
     Text,
     event,
+    func,
+    select,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import DeclarativeBase, Mapped, column_property, mapped_column, relationship
 
 
 class Base(DeclarativeBase):
@@ -153,6 +156,11 @@ class User(Base, UUIDMixin, TimestampMixin):
     
     __table_args__ = (
         Index("ix_users_email", "email"),
+        Index(
+            "ix_users_active_created",
+            text("created_at DESC"),
+            postgresql_where=text("is_active"),
+        ),
     )
 
 
@@ -246,6 +254,10 @@ class Run(Base, UUIDMixin, TimestampMixin):
         Index("ix_runs_status", "status"),
         Index("ix_runs_user", "user_id"),
         Index("ix_runs_created", "created_at"),
+        Index(
+            "ix_runs_user_status_created",
+            "user_id", "status", text("created_at DESC"), text("id DESC"),
+        ),
     )
 
 
@@ -323,6 +335,17 @@ class Sample(Base, UUIDMixin, TimestampMixin):
     )
 
 
+# Sample count as a correlated subquery; deferred, so it is only selected
+# where a query asks for it with undefer(Run.sample_count).
+Run.sample_count = column_property(
+    select(func.count(Sample.id))
+    .where(Sample.run_id == Run.id)
+    .correlate_except(Sample)
+    .scalar_subquery(),
+    deferred=True,
+)
+
+
 # =============================================================================
 # RESULTS MODELS
 # =============================================================================
@@ -5,25 +5,80 @@ Handles downloading, versioning, and verification of reference databases.
 All databases are sourced from authoritative public repositories.
 """
 
+import asyncio
 import hashlib
-import json
-import shutil
+import mmap
+import os
 import subprocess
-from dataclasses import dataclass, field
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from urllib.request import urlretrieve
-from urllib.error import URLError
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
+import orjson
 import structlog
 
 from vgap.config import get_settings
+from vgap.utils.primer_schemes import normalize_scheme_name
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = structlog.get_logger()
 settings = get_settings()
 
+# Download tuning: 1 MiB chunks keep write syscalls low for multi-MB references
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_TIMEOUT = 120.0
+DOWNLOAD_CONNECT_TIMEOUT = 10.0
+MAX_PARALLEL_DOWNLOADS = 8
+
+# Large files on servers that support byte ranges are fetched in parallel parts
+RANGED_DOWNLOAD_MIN_SIZE = 64 << 20
+RANGED_DOWNLOAD_PARTS = 4
+
+
+@lru_cache
+def _http_client() -> "httpx.Client":
+    """
+    Shared HTTP client so repeated downloads reuse keep-alive connections.
+    
+    Responses are requested compressed; iter_bytes() yields decoded content,
+    so files on disk (and their checksums) are always the plain FASTA/BED.
+    """
+    # httpx is only needed for bootstrapping, so keep it out of module import
+    import httpx
+    
+    return httpx.Client(
+        headers={"Accept-Encoding": "gzip, deflate"},
+        timeout=httpx.Timeout(DOWNLOAD_TIMEOUT, connect=DOWNLOAD_CONNECT_TIMEOUT),
+        follow_redirects=True,
+        transport=httpx.HTTPTransport(
+            retries=3,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+        ),
+    )
+
+
+# Checksum tuning: files up to MMAP_CHECKSUM_LIMIT are hashed in a single call
+CHECKSUM_CHUNK_SIZE = 8 << 20
+MMAP_CHECKSUM_LIMIT = 64 << 20
+HAS_FADVISE = hasattr(os, "posix_fadvise")
+HAS_MADVISE = hasattr(mmap, "MADV_SEQUENTIAL")
+
+# ReferenceManager is created per request, so share manifests (keyed by file
+# mtime/size) and recent inventory snapshots across instances. Both are kept
+# serialized so every caller decodes its own dict and none can mutate another's
+INVENTORY_CACHE_TTL = 5.0
+_MANIFEST_CACHE: dict[Path, tuple[tuple[int, int], bytes]] = {}
+_INVENTORY_CACHE: dict[Path, tuple[float, bytes]] = {}
+
 
 class DatabaseStatus(str, Enum):
     """Database installation status."""
@@ -34,7 +89,7 @@ class DatabaseStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseInfo:
     """Information about an installed database."""
     name: str
@@ -61,6 +116,80 @@ class DatabaseInfo:
         }
 
 
+def _sha256_of(path: Path) -> str:
+    """Compute SHA256 checksum of file."""
+    return _hash_file(hashlib.sha256(), path).hexdigest()
+
+
+def _hash_file(sha256: "hashlib._Hash", path: Path) -> "hashlib._Hash":
+    """Feed the contents of a file into an existing hash object."""
+    size = path.stat().st_size
+    # Unbuffered: reads are already large, so skip the BufferedReader layer
+    with open(path, "rb", buffering=0) as f:
+        # Read-once access: hint readahead, then drop the pages so hashing
+        # reference files does not evict data other tools are using
+        if HAS_FADVISE:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if 0 < size <= MMAP_CHECKSUM_LIMIT:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if HAS_MADVISE:
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                sha256.update(mm)
+        else:
+            # Same approach as hashlib.file_digest, with a larger reusable buffer
+            buf = bytearray(CHECKSUM_CHUNK_SIZE)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                sha256.update(view[:n])
+        if HAS_FADVISE:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    return sha256
+
+
+def _gunzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Incrementally decompress a (possibly multi-member) gzip stream."""
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    pending = False
+    for chunk in chunks:
+        while chunk:
+            pending = True
+            data = decompressor.decompress(chunk)
+            if data:
+                yield data
+            if not decompressor.eof:
+                break
+            # Start of the next gzip member, if any
+            chunk = decompressor.unused_data
+            decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+            pending = False
+    if pending:
+        raise EOFError("Compressed stream ended before the end-of-stream marker")
+
+
+def _stat_fingerprint(path: Path) -> dict:
+    """Size and mtime recorded in the manifest to skip unchanged files."""
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _unchanged_since(entry: dict, path: Path) -> bool:
+    """Whether a file still matches the size/mtime its manifest entry recorded."""
+    return bool(entry) and _stat_fingerprint(path) == {
+        "size": entry.get("size"),
+        "mtime_ns": entry.get("mtime_ns"),
+    }
+
+
+def _fasta_sequence_length(path: Path) -> int:
+    """Total residue count across all records, streamed line by line."""
+    seq_length = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.startswith(b">"):
+                seq_length += len(line.strip())
+    return seq_length
+
+
 # Authoritative database sources
 REFERENCE_SOURCES = {
     "sars-cov-2": {
@@ -115,6 +244,49 @@ PRIMER_SCHEMES = {
 }
 
 
+def _build_primer_aliases() -> dict[str, str]:
+    """Map normalized spellings of each primer scheme to its canonical ID."""
+    aliases = {}
+    for scheme_id in PRIMER_SCHEMES:
+        version = scheme_id.split("-", 1)[1]  # e.g. "V4.1"
+        for alias in (scheme_id, version, version[1:]):
+            aliases.setdefault(alias, scheme_id)
+    return aliases
+
+
+_PRIMER_ALIASES = _build_primer_aliases()
+
+
+@lru_cache(maxsize=128)
+def _resolve_primer_key(scheme: str) -> str:
+    """Canonical scheme ID for a user-supplied name (unknown names pass through)."""
+    return _PRIMER_ALIASES.get(normalize_scheme_name(scheme), scheme)
+
+
+@lru_cache
+def _inventory_paths(references_dir: Path) -> tuple[dict[str, str], str, dict[str, str]]:
+    """Expected FASTA paths, primers directory and BED paths (as strings)."""
+    fasta_paths = {
+        ref_id: os.path.join(references_dir, ref_id, "reference.fasta")
+        for ref_id in REFERENCE_SOURCES
+    }
+    primers_dir = os.path.join(references_dir, "primers")
+    bed_paths = {
+        scheme_id: os.path.join(primers_dir, f"{scheme_id}.bed")
+        for scheme_id in PRIMER_SCHEMES
+    }
+    return fasta_paths, primers_dir, bed_paths
+
+
+def _listed_files(directory: str) -> set[str]:
+    """Paths of all regular files in a directory, from a single scandir."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.path for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
 class ReferenceManager:
     """
     Manages reference databases for VGAP.
@@ -130,52 +302,285 @@ class ReferenceManager:
         self.references_dir = references_dir or Path(settings.storage.references_dir)
         self.references_dir.mkdir(parents=True, exist_ok=True)
         self.manifest_path = self.references_dir / "manifest.json"
+        self._manifest_depth = 0
+        self._manifest_dirty = False
         self._load_manifest()
     
     def _load_manifest(self):
         """Load or create database manifest."""
-        if self.manifest_path.exists():
-            with open(self.manifest_path) as f:
-                self.manifest = json.load(f)
-        else:
+        try:
+            stat = self.manifest_path.stat()
+        except FileNotFoundError:
             self.manifest = {
                 "version": "1.0",
                 "databases": {},
                 "primers": {},
                 "last_updated": None,
             }
+            return
+        
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = _MANIFEST_CACHE.get(self.manifest_path)
+        if cached and cached[0] == key:
+            data = cached[1]
+        else:
+            data = self.manifest_path.read_bytes()
+            _MANIFEST_CACHE[self.manifest_path] = (key, data)
+        self.manifest = orjson.loads(data)
     
     def _save_manifest(self):
-        """Save database manifest."""
+        """
+        Save database manifest.
+        
+        Inside _manifest_transaction the write is deferred until the
+        outermost transaction exits.
+        """
+        if self._manifest_depth:
+            self._manifest_dirty = True
+            return
+        
         self.manifest["last_updated"] = datetime.utcnow().isoformat()
-        with open(self.manifest_path, "w") as f:
-            json.dump(self.manifest, f, indent=2)
+        # Write to a temp file and rename so readers never see a partial manifest
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        data = orjson.dumps(self.manifest, option=orjson.OPT_INDENT_2)
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.manifest_path)
+        self._manifest_dirty = False
+        
+        stat = self.manifest_path.stat()
+        _MANIFEST_CACHE[self.manifest_path] = ((stat.st_mtime_ns, stat.st_size), data)
+        _INVENTORY_CACHE.pop(self.references_dir, None)
+    
+    @contextmanager
+    def _manifest_transaction(self):
+        """Batch manifest updates into a single write."""
+        self._manifest_depth += 1
+        try:
+            yield
+        finally:
+            self._manifest_depth -= 1
+            if not self._manifest_depth and self._manifest_dirty:
+                self._save_manifest()
     
     def _compute_checksum(self, path: Path) -> str:
         """Compute SHA256 checksum of file."""
-        sha256 = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(65536), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return _sha256_of(path)
     
-    def _download_file(self, url: str, dest: Path, description: str = "file") -> bool:
-        """Download file from URL with logging."""
+    def _download_file(
+        self,
+        url: str,
+        dest: Path,
+        description: str = "file",
+        compute_sha256: bool = False,
+        etag: Optional[str] = None,
+        decompress_gzip: bool = False,
+    ) -> tuple[bool, Optional[str], Optional[str]]:
+        """
+        Download file from URL with logging.
+        
+        Data is streamed into a ``.part`` file that replaces ``dest`` once
+        complete. A leftover ``.part`` from an interrupted download is resumed
+        with a Range request when its ETag is known. If ``etag`` is given and
+        ``dest`` exists, an unchanged upstream file (304) is not re-fetched.
+        
+        When compute_sha256 is set, the checksum is computed from the
+        streamed chunks so the file does not need to be re-read afterwards.
+        With decompress_gzip, a gzipped payload is inflated on the fly and
+        ``dest`` (and the checksum) hold the decompressed bytes; such
+        downloads are not resumable.
+        Returns (success, checksum, etag); checksum is None on a 304.
+        """
+        import httpx
+        
         logger.info(f"Downloading {description}", url=url, dest=str(dest))
         
+        part_path = dest.with_name(dest.name + ".part")
+        part_etag_path = dest.with_name(dest.name + ".part.etag")
+        
+        headers = {}
+        if etag and dest.exists():
+            headers["If-None-Match"] = etag
+        offset = 0
+        if not decompress_gzip and part_path.exists() and part_etag_path.exists():
+            offset = part_path.stat().st_size
+            # Ranges refer to the encoded body, so resume without compression
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = part_etag_path.read_text()
+            headers["Accept-Encoding"] = "identity"
+        
+        sha256 = hashlib.sha256() if compute_sha256 else None
+        restart = False
         try:
-            urlretrieve(url, dest)
+            with _http_client().stream("GET", url, headers=headers) as response:
+                if response.status_code == 304:
+                    logger.info(f"{description} not modified", url=url)
+                    return True, None, etag
+                if response.status_code == 416:
+                    # Partial file is stale or already complete; start over
+                    # once the response is closed
+                    part_path.unlink(missing_ok=True)
+                    part_etag_path.unlink(missing_ok=True)
+                    restart = True
+                else:
+                    response.raise_for_status()
+                    
+                    new_etag = response.headers.get("ETag")
+                    resumed = response.status_code == 206
+                    if resumed:
+                        logger.info(f"Resuming {description}", offset=offset)
+                        if sha256:
+                            _hash_file(sha256, part_path)
+                    elif new_etag and not decompress_gzip:
+                        part_etag_path.write_text(new_etag)
+                    else:
+                        part_etag_path.unlink(missing_ok=True)
+                    
+                    chunks = response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE)
+                    if decompress_gzip:
+                        chunks = _gunzip_chunks(chunks)
+                    
+                    mode = "ab" if resumed else "wb"
+                    with open(part_path, mode, buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                        for chunk in chunks:
+                            if sha256:
+                                sha256.update(chunk)
+                            f.write(chunk)
+            
+            if restart:
+                return self._download_file(
+                    url, dest, description, compute_sha256, etag, decompress_gzip
+                )
+            
+            os.replace(part_path, dest)
+            part_etag_path.unlink(missing_ok=True)
             logger.info(f"Downloaded {description}", size=dest.stat().st_size)
-            return True
-        except URLError as e:
+            return True, sha256.hexdigest() if sha256 else None, new_etag
+        except httpx.HTTPError as e:
             logger.error(f"Failed to download {description}", error=str(e))
-            return False
+            return False, None, None
         except Exception as e:
             logger.error(f"Unexpected error downloading {description}", error=str(e))
-            return False
+            return False, None, None
+    
+    def _index_fasta(self, fasta_path: Path) -> Optional[Path]:
+        """Build a samtools FAI index next to the FASTA."""
+        try:
+            subprocess.run(
+                ["samtools", "faidx", str(fasta_path)],
+                check=True,
+                capture_output=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning("FASTA indexing failed", path=str(fasta_path), error=str(e))
+            return None
+        return fasta_path.with_name(fasta_path.name + ".fai")
+    
+    def _download_file_ranged(
+        self,
+        url: str,
+        dest: Path,
+        description: str = "file",
+        compute_sha256: bool = False,
+        etag: Optional[str] = None,
+        n_parts: int = RANGED_DOWNLOAD_PARTS,
+    ) -> tuple[bool, Optional[str], Optional[str]]:
+        """
+        Download a large file as concurrent byte-range requests.
+        
+        Falls back to a single streamed GET (_download_file) when the server
+        does not advertise byte ranges, the file is smaller than
+        RANGED_DOWNLOAD_MIN_SIZE, or any part fails. Same return value as
+        _download_file.
+        """
+        import httpx
+        
+        client = _http_client()
+        # Ranges refer to the encoded body, so request it uncompressed
+        identity = {"Accept-Encoding": "identity"}
+        try:
+            head = client.head(url, headers=identity)
+            head.raise_for_status()
+            size = int(head.headers.get("Content-Length", 0))
+        except (httpx.HTTPError, ValueError):
+            size = 0
+        else:
+            if head.headers.get("Accept-Ranges") != "bytes":
+                size = 0
+        
+        if size < RANGED_DOWNLOAD_MIN_SIZE:
+            return self._download_file(url, dest, description, compute_sha256, etag)
+        
+        remote_etag = head.headers.get("ETag")
+        if etag and etag == remote_etag and dest.exists():
+            logger.info(f"{description} not modified", url=url)
+            return True, None, etag
+        
+        logger.info(f"Downloading {description} in {n_parts} ranges", url=url, size=size)
+        
+        bounds = [(i * size // n_parts, (i + 1) * size // n_parts - 1) for i in range(n_parts)]
+        part_paths = [dest.with_name(f"{dest.name}.range{i}") for i in range(n_parts)]
+        
+        def fetch_part(i: int) -> None:
+            start, end = bounds[i]
+            headers = {**identity, "Range": f"bytes={start}-{end}"}
+            if remote_etag:
+                headers["If-Range"] = remote_etag
+            with client.stream("GET", url, headers=headers) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise ValueError(f"Range request answered with {response.status_code}")
+                with open(part_paths[i], "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                    for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+        
+        assembled_path = dest.with_name(dest.name + ".ranged")
+        sha256 = hashlib.sha256() if compute_sha256 else None
+        try:
+            with ThreadPoolExecutor(max_workers=n_parts) as executor:
+                list(executor.map(fetch_part, range(n_parts)))
+            
+            # Concatenate parts in order, hashing as we go
+            with open(assembled_path, "wb") as out:
+                for part_path in part_paths:
+                    with open(part_path, "rb") as part:
+                        while chunk := part.read(DOWNLOAD_CHUNK_SIZE):
+                            if sha256:
+                                sha256.update(chunk)
+                            out.write(chunk)
+            if assembled_path.stat().st_size != size:
+                raise ValueError("Assembled size does not match Content-Length")
+            os.replace(assembled_path, dest)
+        except Exception as e:
+            logger.warning(
+                f"Ranged download of {description} failed, retrying as single request",
+                error=str(e),
+            )
+            assembled_path.unlink(missing_ok=True)
+            return self._download_file(url, dest, description, compute_sha256, etag)
+        finally:
+            for part_path in part_paths:
+                part_path.unlink(missing_ok=True)
+        
+        logger.info(f"Downloaded {description}", size=size)
+        return True, sha256.hexdigest() if sha256 else None, remote_etag
     
     def get_inventory(self) -> dict:
-        """Get complete database inventory."""
+        """
+        Get complete database inventory.
+        
+        Snapshots are cached for INVENTORY_CACHE_TTL seconds and dropped
+        whenever the manifest is saved. Each call returns a fresh dict.
+        """
+        cached = _INVENTORY_CACHE.get(self.references_dir)
+        if cached and time.monotonic() - cached[0] < INVENTORY_CACHE_TTL:
+            return orjson.loads(cached[1])
+        
+        inventory = self._build_inventory()
+        _INVENTORY_CACHE[self.references_dir] = (time.monotonic(), orjson.dumps(inventory))
+        return inventory
+    
+    def _build_inventory(self) -> dict:
+        """Scan the references directory and build the inventory."""
         inventory = {
             "references": {},
             "primers": {},
@@ -183,18 +588,19 @@ class ReferenceManager:
             "missing_critical": [],
         }
         
+        fasta_paths, primers_dir, bed_paths = _inventory_paths(self.references_dir)
+        
         # Check references
         for ref_id, ref_info in REFERENCE_SOURCES.items():
-            ref_dir = self.references_dir / ref_id
-            fasta_path = ref_dir / "reference.fasta"
+            fasta_path = fasta_paths[ref_id]
             
-            if fasta_path.exists():
+            if os.path.exists(fasta_path):
                 db_info = self.manifest.get("databases", {}).get(ref_id, {})
                 inventory["references"][ref_id] = {
                     "name": ref_info["name"],
                     "status": "installed",
                     "version": db_info.get("version", "unknown"),
-                    "path": str(fasta_path),
+                    "path": fasta_path,
                     "installed_at": db_info.get("installed_at"),
                     "checksum": db_info.get("checksum"),
                 }
@@ -207,17 +613,17 @@ class ReferenceManager:
                 }
                 inventory["missing_critical"].append(ref_id)
         
-        # Check primer schemes
-        primers_dir = self.references_dir / "primers"
+        # Check primer schemes (one directory listing instead of a stat per scheme)
+        installed_beds = _listed_files(primers_dir)
         for scheme_id, scheme_info in PRIMER_SCHEMES.items():
-            bed_path = primers_dir / f"{scheme_id}.bed"
+            bed_path = bed_paths[scheme_id]
             
-            if bed_path.exists():
+            if bed_path in installed_beds:
                 db_info = self.manifest.get("primers", {}).get(scheme_id, {})
                 inventory["primers"][scheme_id] = {
                     "name": scheme_info["name"],
                     "status": "installed",
-                    "path": str(bed_path),
+                    "path": bed_path,
                     "amplicon_length": scheme_info["amplicon_length"],
                     "checksum": db_info.get("checksum"),
                 }
@@ -253,47 +659,44 @@ class ReferenceManager:
         
         logger.info("Bootstrapping reference", ref_id=ref_id, url=ref_info["url"])
         
-        # Download reference genome
-        # Note: If .gz, we might need to decompress. For now assuming urlretrieve handles it or caller handles it.
-        # Ideally we should unzip if it ends in .gz
+        # Download reference genome; gzipped sources are decompressed while
+        # streaming so the checksum always covers the plain FASTA
         is_gzipped = ref_info["url"].endswith(".gz")
-        download_path = fasta_path.with_suffix(".gz") if is_gzipped else fasta_path
-        
-        if not self._download_file(
-            ref_info["url"],
-            download_path,
-            f"{ref_info['name']}"
-        ):
+        cached = self.manifest["databases"].get(ref_id, {})
+        if is_gzipped:
+            downloaded, checksum, etag = self._download_file(
+                ref_info["url"],
+                fasta_path,
+                f"{ref_info['name']}",
+                compute_sha256=True,
+                etag=cached.get("etag"),
+                decompress_gzip=True,
+            )
+        else:
+            downloaded, checksum, etag = self._download_file_ranged(
+                ref_info["url"],
+                fasta_path,
+                f"{ref_info['name']}",
+                compute_sha256=True,
+                etag=cached.get("etag"),
+            )
+        if not downloaded:
             return DatabaseInfo(
                 name=ref_info["name"],
                 version="unknown",
                 status=DatabaseStatus.ERROR,
                 error_message="Failed to download reference genome"
             )
-            
-        # Decompress if needed
-        if is_gzipped and download_path.exists():
-             import gzip
-             try:
-                 with gzip.open(download_path, 'rb') as f_in:
-                     with open(fasta_path, 'wb') as f_out:
-                         shutil.copyfileobj(f_in, f_out)
-             except Exception as e:
-                 logger.error("Decompression failed", error=str(e))
-                 return DatabaseInfo(
-                    name=ref_info["name"],
-                    version="unknown",
-                    status=DatabaseStatus.ERROR,
-                    error_message=f"Decompression failed: {str(e)}"
-                )
+        
+        # On a 304 with the file untouched since install, reuse the recorded
+        # checksum and length rather than reading the genome again
+        unchanged = checksum is None and _unchanged_since(cached, fasta_path)
         
         # Verify genome length if expected
-        seq_length = 0
-        if fasta_path.exists():
-            with open(fasta_path) as f:
-                content = f.read()
-                # fasta parsing is rough here but okay for now
-                seq_length = len("".join([l.strip() for l in content.split("\n") if not l.startswith(">")]))
+        if unchanged and "length" in cached:
+            seq_length = cached["length"]
+        else:
+            seq_length = _fasta_sequence_length(fasta_path) if fasta_path.exists() else 0
         
         if "expected_length" in ref_info and seq_length != ref_info["expected_length"]:
             logger.warning(
@@ -302,18 +705,28 @@ class ReferenceManager:
                 actual=seq_length
             )
         
-        # Compute checksum
-        checksum = self._compute_checksum(fasta_path)
+        # Compute checksum (already known unless the server answered 304)
+        if checksum is None:
+            checksum = cached.get("checksum") if unchanged else None
+        if checksum is None:
+            checksum = self._compute_checksum(fasta_path)
+        
+        # Index once here so pipeline runs never pay for it
+        fai_path = self._index_fasta(fasta_path)
         
         # Update manifest
+        installed_at = datetime.utcnow()
         self.manifest["databases"][ref_id] = {
             "name": ref_info["name"],
             "version": ref_info.get("accession", "latest"),
             "accession": ref_info.get("accession", "latest"),
             "checksum": checksum,
             "length": seq_length,
-            "installed_at": datetime.utcnow().isoformat(),
+            "etag": etag,
+            "installed_at": installed_at.isoformat(),
             "path": str(fasta_path),
+            "fai_path": str(fai_path) if fai_path else None,
+            **_stat_fingerprint(fasta_path),
         }
         self._save_manifest()
         
@@ -324,7 +737,7 @@ class ReferenceManager:
             path=fasta_path,
             source_url=ref_info["url"],
             checksum=checksum,
-            installed_at=datetime.utcnow(),
+            installed_at=installed_at,
         )
 
     def bootstrap_sars_cov_2(self) -> DatabaseInfo:
@@ -341,24 +754,45 @@ class ReferenceManager:
         primers_dir.mkdir(parents=True, exist_ok=True)
         
         results = []
+        # One timestamp for the whole batch
+        installed_at = datetime.utcnow()
+        installed_at_iso = installed_at.isoformat()
+        
+        # Schemes are independent downloads, so fetch them concurrently and
+        # apply the results to the manifest in order afterwards
+        downloads = {}
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as executor:
+            for scheme_id, scheme_info in PRIMER_SCHEMES.items():
+                logger.info("Downloading primer scheme", scheme=scheme_id)
+                
+                cached = self.manifest["primers"].get(scheme_id, {})
+                downloads[scheme_id] = executor.submit(
+                    self._download_file,
+                    scheme_info["url"],
+                    primers_dir / f"{scheme_id}.bed",
+                    f"Primer scheme {scheme_info['name']}",
+                    compute_sha256=True,
+                    etag=cached.get("etag"),
+                )
         
         for scheme_id, scheme_info in PRIMER_SCHEMES.items():
             bed_path = primers_dir / f"{scheme_id}.bed"
-            
-            logger.info("Downloading primer scheme", scheme=scheme_id)
-            
-            if self._download_file(
-                scheme_info["url"],
-                bed_path,
-                f"Primer scheme {scheme_info['name']}"
-            ):
-                checksum = self._compute_checksum(bed_path)
+            downloaded, checksum, etag = downloads[scheme_id].result()
+            if downloaded:
+                if checksum is None:
+                    cached = self.manifest["primers"].get(scheme_id, {})
+                    if _unchanged_since(cached, bed_path):
+                        checksum = cached.get("checksum")
+                if checksum is None:
+                    checksum = self._compute_checksum(bed_path)
                 
                 self.manifest["primers"][scheme_id] = {
                     "name": scheme_info["name"],
                     "checksum": checksum,
-                    "installed_at": datetime.utcnow().isoformat(),
+                    "etag": etag,
+                    "installed_at": installed_at_iso,
                     "path": str(bed_path),
+                    **_stat_fingerprint(bed_path),
                 }
                 
                 results.append(DatabaseInfo(
@@ -368,7 +802,7 @@ class ReferenceManager:
                     path=bed_path,
                     source_url=scheme_info["url"],
                     checksum=checksum,
-                    installed_at=datetime.utcnow(),
+                    installed_at=installed_at,
                 ))
             else:
                 results.append(DatabaseInfo(
@@ -396,27 +830,35 @@ class ReferenceManager:
             "errors": [],
         }
         
-        # Bootstrap References (All)
-        for ref_id in REFERENCE_SOURCES:
-            # We only strictly enforce SARS-CoV-2 auto-bootstrap for now to avoid massive downloads
-            # But the user might want explicitly requested ones.
-            # For now, let's keep behavior: only bootstrap sars-cov-2 by default OR all?
-            # "One-click bootstrap" implies admin action. auto-bootstrap might be too much.
-            # Let's just bootstrap sars-cov-2 to maintain 'bootstrap_all' legacy contract
-            if ref_id == "sars-cov-2":
-                 res = self.bootstrap_reference(ref_id)
-                 results["references"][ref_id] = res.to_dict()
-                 if res.status == DatabaseStatus.ERROR:
-                     results["success"] = False
-                     results["errors"].append(res.error_message)
-        
-        # Bootstrap primer schemes
-        primer_results = self.bootstrap_primer_schemes()
-        for pr in primer_results:
-            results["primers"][pr.name] = pr.to_dict()
-            if pr.status == DatabaseStatus.ERROR:
-                results["success"] = False
-                results["errors"].append(pr.error_message)
+        # The reference downloads in the background while primer schemes are
+        # fetched; manifest writes are deferred until both are done
+        with self._manifest_transaction(), ThreadPoolExecutor(max_workers=1) as executor:
+            # Bootstrap References (All)
+            reference_futures = {}
+            for ref_id in REFERENCE_SOURCES:
+                # We only strictly enforce SARS-CoV-2 auto-bootstrap for now to avoid massive downloads
+                # But the user might want explicitly requested ones.
+                # For now, let's keep behavior: only bootstrap sars-cov-2 by default OR all?
+                # "One-click bootstrap" implies admin action. auto-bootstrap might be too much.
+                # Let's just bootstrap sars-cov-2 to maintain 'bootstrap_all' legacy contract
+                if ref_id == "sars-cov-2":
+                     reference_futures[ref_id] = executor.submit(self.bootstrap_reference, ref_id)
+        
+            # Bootstrap primer schemes
+            primer_results = self.bootstrap_primer_schemes()
+            
+            for ref_id, future in reference_futures.items():
+                res = future.result()
+                results["references"][ref_id] = res.to_dict()
+                if res.status == DatabaseStatus.ERROR:
+                    results["success"] = False
+                    results["errors"].append(res.error_message)
+            
+            for pr in primer_results:
+                results["primers"][pr.name] = pr.to_dict()
+                if pr.status == DatabaseStatus.ERROR:
+                    results["success"] = False
+                    results["errors"].append(pr.error_message)
         
         logger.info(
             "Database bootstrap complete",
@@ -426,6 +868,14 @@ class ReferenceManager:
         
         return results
     
+    async def bootstrap_reference_async(self, ref_id: str) -> DatabaseInfo:
+        """Run bootstrap_reference in a worker thread for async callers."""
+        return await asyncio.to_thread(self.bootstrap_reference, ref_id)
+    
+    async def bootstrap_all_async(self) -> dict:
+        """Run bootstrap_all in a worker thread for async callers."""
+        return await asyncio.to_thread(self.bootstrap_all)
+    
     def get_reference_path(self, virus: str = "sars-cov-2") -> Optional[Path]:
         """Get path to reference genome."""
         ref_path = self.references_dir / virus / "reference.fasta"
@@ -433,44 +883,52 @@ class ReferenceManager:
     
     def get_primer_path(self, scheme: str) -> Optional[Path]:
         """Get path to primer scheme BED file."""
-        # Normalize scheme name
-        scheme_key = scheme.upper().replace("_", "-").replace("V", "-V")
-        if not scheme_key.startswith("ARTIC-"):
-            scheme_key = f"ARTIC-{scheme_key}"
+        # Known schemes resolve through the alias table; anything else is
+        # treated as the file name of a custom scheme
+        scheme_key = _resolve_primer_key(scheme)
         
         bed_path = self.references_dir / "primers" / f"{scheme_key}.bed"
-        if bed_path.exists():
-            return bed_path
-        
-        # Try alternative naming conventions
-        for key in PRIMER_SCHEMES:
-            if scheme.lower() in key.lower():
-                alt_path = self.references_dir / "primers" / f"{key}.bed"
-                if alt_path.exists():
-                    return alt_path
-        
-        return None
+        return bed_path if bed_path.exists() else None
     
-    def verify_integrity(self) -> dict:
-        """Verify integrity of all installed databases."""
+    def verify_integrity(self, deep: bool = False) -> dict:
+        """
+        Verify integrity of all installed databases and primer schemes.
+        
+        Files whose size and mtime still match the values recorded at install
+        time are trusted without re-hashing unless ``deep`` is set.
+        """
         results = {"valid": True, "issues": []}
         
-        for ref_id, ref_data in self.manifest.get("databases", {}).items():
-            path = Path(ref_data.get("path", ""))
-            if not path.exists():
-                results["valid"] = False
-                results["issues"].append(f"Missing file: {path}")
-                continue
-            
-            checksum = self._compute_checksum(path)
-            if checksum != ref_data.get("checksum"):
-                results["valid"] = False
-                results["issues"].append(f"Checksum mismatch: {ref_id}")
-        
-        for scheme_id, scheme_data in self.manifest.get("primers", {}).items():
-            path = Path(scheme_data.get("path", ""))
-            if not path.exists():
-                results["valid"] = False
-                results["issues"].append(f"Missing primer scheme: {path}")
+        sections = (("databases", "Missing file"), ("primers", "Missing primer scheme"))
+        
+        # (entry ID, manifest entry, path) for every file that needs re-hashing
+        to_hash: list[tuple[str, dict, Path]] = []
+        for section, missing_label in sections:
+            for entry_id, data in self.manifest.get(section, {}).items():
+                path = Path(data.get("path", ""))
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    results["valid"] = False
+                    results["issues"].append(f"{missing_label}: {path}")
+                    continue
+                
+                if not data.get("checksum") or (
+                    not deep
+                    and stat.st_size == data.get("size")
+                    and stat.st_mtime_ns == data.get("mtime_ns")
+                ):
+                    continue
+                to_hash.append((entry_id, data, path))
+        
+        # hashlib releases the GIL while hashing, so files are hashed in parallel
+        if to_hash:
+            workers = min(len(to_hash), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                checksums = executor.map(_sha256_of, [path for _, _, path in to_hash])
+                for (entry_id, data, _), checksum in zip(to_hash, checksums, strict=True):
+                    if checksum != data["checksum"]:
+                        results["valid"] = False
+                        results["issues"].append(f"Checksum mismatch: {entry_id}")
         
         return results
@@ -9,14 +9,35 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 import structlog
-from sqlalchemy import select, update, func
+from sqlalchemy import bindparam, insert, select, update, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
 from vgap.models import Run, Sample, RunStatus, SampleStatus, AuditLog, AuditAction
 
 logger = structlog.get_logger()
 
+# Hot read statements are built once; the engine's compiled cache then
+# reuses their SQL and only the bound values change per call.
+_SELECT_RUN_BY_ID = select(Run).where(Run.id == bindparam("run_id"))
+_SELECT_RUN_BY_CODE = select(Run).where(Run.run_code == bindparam("run_code"))
+_SELECT_RUN_SAMPLES = (
+    select(Sample).where(Sample.run_id == bindparam("run_id")).order_by(Sample.sample_id)
+)
+_COUNT_RUN_SAMPLES = (
+    select(func.count()).select_from(Sample).where(Sample.run_id == bindparam("run_id"))
+)
+
+
+_DEFAULT_COLLECTION_DATE = datetime(2024, 1, 1)
+
+
+def _parse_collection_date(value: Optional[str]) -> datetime:
+    """Parse a YYYY-MM-DD collection date (metadata schema enforces the format)."""
+    if not value:
+        return _DEFAULT_COLLECTION_DATE
+    return datetime.fromisoformat(value)
+
 
 def generate_run_code() -> str:
     """Generate unique run code."""
@@ -69,10 +90,8 @@ async def create_run(
         created_at=datetime.utcnow(),
     )
     
-    session.add(run)
-    await session.flush()
-    
-    # Audit log
+    # Audit log; run.id is assigned client-side, so both rows go out in
+    # the caller's next flush instead of forcing one here.
     audit = AuditLog(
         id=uuid4(),
         user_id=user_id,
@@ -82,13 +101,42 @@ async def create_run(
         details={"name": name, "mode": mode},
         timestamp=datetime.utcnow(),
     )
-    session.add(audit)
+    session.add_all([run, audit])
     
     logger.info("Run created", run_id=str(run.id), run_code=run.run_code)
     
     return run
 
 
+def _sample_values(
+    run_id: UUID,
+    sample_id: str,
+    metadata: dict,
+    r1_path: str,
+    r2_path: Optional[str] = None,
+) -> dict:
+    """Column values for a new Sample row."""
+    return {
+        "id": uuid4(),
+        "run_id": run_id,
+        "sample_id": sample_id,
+        "r1_path": r1_path,
+        "r2_path": r2_path,
+        "status": SampleStatus.PENDING,
+        "collection_date": _parse_collection_date(metadata.get("collection_date")),
+        "host": metadata.get("host", "human"),
+        "location": metadata.get("location", ""),
+        "protocol": metadata.get("protocol", "amplicon"),
+        "platform": metadata.get("platform", ""),
+        "sequencing_run_id": metadata.get("run_id", ""),
+        "batch_id": metadata.get("batch_id", ""),
+        "is_control": metadata.get("is_control", False),
+        "control_type": metadata.get("control_type"),
+        "sample_metadata": metadata,
+        "created_at": datetime.utcnow(),
+    }
+
+
 async def add_sample_to_run(
     session: AsyncSession,
     run_id: UUID,
@@ -111,25 +159,7 @@ async def add_sample_to_run(
     Returns:
         Created Sample object
     """
-    sample = Sample(
-        id=uuid4(),
-        run_id=run_id,
-        sample_id=sample_id,
-        r1_path=r1_path,
-        r2_path=r2_path,
-        status=SampleStatus.PENDING,
-        collection_date=datetime.strptime(metadata.get("collection_date", "2024-01-01"), "%Y-%m-%d"),
-        host=metadata.get("host", "human"),
-        location=metadata.get("location", ""),
-        protocol=metadata.get("protocol", "amplicon"),
-        platform=metadata.get("platform", ""),
-        sequencing_run_id=metadata.get("run_id", ""),
-        batch_id=metadata.get("batch_id", ""),
-        is_control=metadata.get("is_control", False),
-        control_type=metadata.get("control_type"),
-        sample_metadata=metadata,
-        created_at=datetime.utcnow(),
-    )
+    sample = Sample(**_sample_values(run_id, sample_id, metadata, r1_path, r2_path))
     
     session.add(sample)
     await session.flush()
@@ -139,13 +169,41 @@ async def add_sample_to_run(
     return sample
 
 
+async def add_samples_bulk(
+    session: AsyncSession,
+    run_id: UUID,
+    rows: list[dict],
+) -> int:
+    """
+    Add many samples to a run with a single multi-row INSERT.
+    
+    Args:
+        session: Database session
+        run_id: Run ID
+        rows: One dict per sample with sample_id, metadata, r1_path and
+            optional r2_path (the arguments of add_sample_to_run)
+    
+    Returns:
+        Number of samples inserted
+    """
+    if not rows:
+        return 0
+    
+    values = [_sample_values(run_id, **row) for row in rows]
+    await session.execute(insert(Sample), values)
+    
+    logger.info("Samples added to run", run_id=str(run_id), count=len(values))
+    
+    return len(values)
+
+
 async def get_run_by_id(
     session: AsyncSession,
     run_id: UUID,
     include_samples: bool = False,
 ) -> Optional[Run]:
     """Get a run by its ID."""
-    query = select(Run).where(Run.id == run_id)
+    query = _SELECT_RUN_BY_ID
     
     if include_samples:
         query = query.options(
@@ -157,7 +215,7 @@ async def get_run_by_id(
             )
         )
     
-    result = await session.execute(query)
+    result = await session.execute(query, {"run_id": run_id})
     return result.scalar_one_or_none()
 
 
@@ -166,9 +224,7 @@ async def get_run_by_code(
     run_code: str,
 ) -> Optional[Run]:
     """Get a run by its code."""
-    result = await session.execute(
-        select(Run).where(Run.run_code == run_code)
-    )
+    result = await session.execute(_SELECT_RUN_BY_CODE, {"run_code": run_code})
     return result.scalar_one_or_none()
 
 
@@ -178,6 +234,7 @@ async def list_runs(
     status_filter: Optional[RunStatus] = None,
     skip: int = 0,
     limit: int = 50,
+    after: Optional[tuple[datetime, UUID]] = None,
 ) -> tuple[list[Run], int]:
     """
     List runs with filtering and pagination.
@@ -188,31 +245,51 @@ async def list_runs(
         status_filter: Filter by status
         skip: Number to skip
         limit: Maximum to return
+        after: Keyset cursor (created_at, id) of the last run on the
+            previous page; replaces skip, and total_count then counts
+            only the runs from the cursor onward
     
     Returns:
-        Tuple of (runs, total_count)
+        Tuple of (runs, total_count); each run has sample_count loaded
     """
-    query = select(Run)
-    count_query = select(func.count()).select_from(Run)
+    filters = []
     
     if user_id:
-        query = query.where(Run.user_id == user_id)
-        count_query = count_query.where(Run.user_id == user_id)
+        filters.append(Run.user_id == user_id)
     
     if status_filter:
-        query = query.where(Run.status == status_filter)
-        count_query = count_query.where(Run.status == status_filter)
+        filters.append(Run.status == status_filter)
+    
+    if after is not None:
+        # Keyset pagination walks ix_runs_user_status_created instead of
+        # scanning and discarding `skip` rows.
+        filters.append(tuple_(Run.created_at, Run.id) < tuple_(*after))
+        skip = 0
+    
+    # COUNT(*) OVER () returns the total alongside each page row, so the
+    # common case costs a single round-trip.
+    query = (
+        select(Run, func.count().over().label("total"))
+        .options(undefer(Run.sample_count))
+        .where(*filters)
+        .order_by(Run.created_at.desc(), Run.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    result = await session.execute(query)
+    rows = result.all()
     
-    # Get count
-    count_result = await session.execute(count_query)
-    total = count_result.scalar()
+    if rows:
+        return [row.Run for row in rows], rows[0].total
     
-    # Get runs
-    query = query.order_by(Run.created_at.desc()).offset(skip).limit(limit)
-    result = await session.execute(query)
-    runs = result.scalars().all()
+    if not skip:
+        return [], 0
     
-    return list(runs), total
+    # Paged past the end: no row carries the window total
+    count_result = await session.execute(
+        select(func.count()).select_from(Run).where(*filters)
+    )
+    return [], count_result.scalar()
 
 
 async def update_run_status(
@@ -278,9 +355,7 @@ async def get_run_samples(
     run_id: UUID,
 ) -> list[Sample]:
     """Get all samples for a run."""
-    result = await session.execute(
-        select(Sample).where(Sample.run_id == run_id).order_by(Sample.sample_id)
-    )
+    result = await session.execute(_SELECT_RUN_SAMPLES, {"run_id": run_id})
     return list(result.scalars().all())
 
 
@@ -289,9 +364,7 @@ async def get_run_sample_count(
     run_id: UUID,
 ) -> int:
     """Get sample count for a run."""
-    result = await session.execute(
-        select(func.count()).select_from(Sample).where(Sample.run_id == run_id)
-    )
+    result = await session.execute(_COUNT_RUN_SAMPLES, {"run_id": run_id})
     return result.scalar()
 
 
@@ -311,15 +384,22 @@ async def cancel_run(
     Returns:
         True if cancelled
     """
-    run = await get_run_by_id(session, run_id)
-    if not run:
-        return False
-    
-    if run.status not in [RunStatus.PENDING, RunStatus.QUEUED, RunStatus.RUNNING]:
+    # Check and transition in one statement; the FROM snapshot supplies the
+    # pre-update status for the audit entry.
+    previous = select(Run.id, Run.status).where(Run.id == run_id).subquery()
+    result = await session.execute(
+        update(Run)
+        .where(
+            Run.id == previous.c.id,
+            Run.status.in_([RunStatus.PENDING, RunStatus.QUEUED, RunStatus.RUNNING]),
+        )
+        .values(status=RunStatus.CANCELLED, completed_at=datetime.utcnow())
+        .returning(previous.c.status)
+    )
+    previous_status = result.scalar_one_or_none()
+    if previous_status is None:
         return False
     
-    await update_run_status(session, run_id, RunStatus.CANCELLED)
-    
     # Audit log
     audit = AuditLog(
         id=uuid4(),
@@ -327,7 +407,7 @@ async def cancel_run(
         action=AuditAction.UPDATE,
         resource_type="run",
         resource_id=str(run_id),
-        details={"action": "cancel", "previous_status": run.status.value},
+        details={"action": "cancel", "previous_status": previous_status.value},
         timestamp=datetime.utcnow(),
     )
     session.add(audit)
@@ -355,15 +435,16 @@ async def start_run(
     """
     from vgap.services.pipeline import process_run
     
-    run = await get_run_by_id(session, run_id)
-    if not run:
-        return False
-    
-    if run.status != RunStatus.PENDING:
+    # Atomically move PENDING -> QUEUED; no row back means the run is
+    # missing or was already started.
+    result = await session.execute(
+        update(Run)
+        .where(Run.id == run_id, Run.status == RunStatus.PENDING)
+        .values(status=RunStatus.QUEUED)
+        .returning(Run.id)
+    )
+    if result.scalar_one_or_none() is None:
         return False
-    
-    # Update status to queued
-    await update_run_status(session, run_id, RunStatus.QUEUED)
     await session.commit()
     
     try:
@@ -4,20 +4,37 @@ VGAP File Upload Service
 Handles file uploads with streaming and validation.
 """
 
+import asyncio
+import errno
 import hashlib
+import os
+import re
 import shutil
 from pathlib import Path
 from typing import AsyncGenerator, Optional
 from uuid import uuid4
 
 import aiofiles
+import aiofiles.os
+import orjson
 import structlog
 
 from vgap.config import get_settings
+from vgap.utils.provenance import sha256_files
 
 logger = structlog.get_logger()
 settings = get_settings()
 
+# Shell metacharacters and whitespace rejected in uploaded filenames
+_UNSAFE_FILENAME_RE = re.compile(r"[ ;&|$`(){}\[\]<>!#*?~]")
+_VALID_EXTENSIONS = ('.fastq', '.fq', '.fastq.gz', '.fq.gz')
+
+# Target size of each buffered write issued by stream_upload
+UPLOAD_WRITE_SIZE = 1 << 20
+
+# Per-session sidecar of checksums computed while streaming uploads
+CHECKSUM_SIDECAR = ".manifest.jsonl"
+
 
 class UploadService:
     """Handle file uploads with streaming and validation."""
@@ -27,6 +44,20 @@ class UploadService:
         self.upload_dir.mkdir(parents=True, exist_ok=True)
         self.max_size = settings.storage.max_upload_size_gb * 1024 * 1024 * 1024
     
+    def session_path(self, session_id: str) -> Path:
+        """
+        Directory for an upload session or run.
+        
+        Directories are sharded by the first two characters of the ID so
+        upload_dir itself stays small; directories created before sharding
+        are still found at the top level.
+        """
+        sharded = self.upload_dir / session_id[:2] / session_id
+        if sharded.exists():
+            return sharded
+        legacy = self.upload_dir / session_id
+        return legacy if legacy.exists() else sharded
+    
     def validate_filename(self, filename: str) -> tuple[bool, str]:
         """
         Validate filename is safe.
@@ -35,21 +66,17 @@ class UploadService:
             Tuple of (is_valid, error_message)
         """
         # Check for unsafe characters
-        unsafe_chars = [' ', ';', '&', '|', '$', '`', '(', ')', '{', '}', 
-                       '[', ']', '<', '>', '!', '#', '*', '?', '~']
-        
-        for char in unsafe_chars:
-            if char in filename:
-                return False, f"Filename contains unsafe character: '{char}'"
+        unsafe = _UNSAFE_FILENAME_RE.search(filename)
+        if unsafe:
+            return False, f"Filename contains unsafe character: '{unsafe.group()}'"
         
         # Check for path traversal
         if '..' in filename or filename.startswith('/'):
             return False, "Filename contains path traversal characters"
         
         # Check extension
-        valid_extensions = ['.fastq', '.fq', '.fastq.gz', '.fq.gz']
-        if not any(filename.lower().endswith(ext) for ext in valid_extensions):
-            return False, f"Invalid file extension. Allowed: {valid_extensions}"
+        if not filename.lower().endswith(_VALID_EXTENSIONS):
+            return False, f"Invalid file extension. Allowed: {list(_VALID_EXTENSIONS)}"
         
         return True, ""
     
@@ -61,7 +88,7 @@ class UploadService:
             Session ID for this upload
         """
         session_id = str(uuid4())
-        session_dir = self.upload_dir / session_id
+        session_dir = self.upload_dir / session_id[:2] / session_id
         session_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info("Created upload session", session_id=session_id)
@@ -89,7 +116,7 @@ class UploadService:
         if not is_valid:
             raise ValueError(error)
         
-        session_dir = self.upload_dir / session_id
+        session_dir = self.session_path(session_id)
         if not session_dir.exists():
             raise ValueError(f"Invalid session: {session_id}")
         
@@ -97,22 +124,58 @@ class UploadService:
         
         sha256 = hashlib.sha256()
         size = 0
+        # Small stream chunks are coalesced so each thread hop writes ~1 MiB
+        pending: list[bytes] = []
+        pending_size = 0
+        write = None
         
-        async with aiofiles.open(file_path, 'wb') as f:
-            async for chunk in stream:
-                # Check size limit
-                size += len(chunk)
-                if size > self.max_size:
-                    # Clean up and raise
-                    await f.close()
-                    file_path.unlink()
-                    raise ValueError(f"File exceeds size limit: {self.max_size} bytes")
-                
-                await f.write(chunk)
-                sha256.update(chunk)
+        try:
+            async with aiofiles.open(file_path, 'wb') as f:
+                try:
+                    async for chunk in stream:
+                        # Check size limit
+                        size += len(chunk)
+                        if size > self.max_size:
+                            raise ValueError(f"File exceeds size limit: {self.max_size} bytes")
+                        
+                        # Hash while the previous batch is still being written
+                        sha256.update(chunk)
+                        pending.append(chunk)
+                        pending_size += len(chunk)
+                        
+                        if pending_size >= UPLOAD_WRITE_SIZE:
+                            if write:
+                                await write
+                            write = asyncio.ensure_future(f.write(b"".join(pending)))
+                            pending.clear()
+                            pending_size = 0
+                    
+                    if write:
+                        await write
+                    if pending:
+                        await f.write(b"".join(pending))
+                finally:
+                    # Never close the file under an in-flight write, and
+                    # retrieve its outcome even when the stream failed first
+                    if write:
+                        await asyncio.gather(write, return_exceptions=True)
+        except BaseException:
+            # Client disconnect, size limit or write error: drop the partial file
+            file_path.unlink(missing_ok=True)
+            raise
         
         checksum = sha256.hexdigest()
         
+        # Record the streamed checksum so finalize_session need not re-read
+        stat = await aiofiles.os.stat(file_path)
+        async with aiofiles.open(session_dir / CHECKSUM_SIDECAR, 'ab') as sidecar:
+            await sidecar.write(orjson.dumps({
+                "filename": filename,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": checksum,
+            }) + b"\n")
+        
         logger.info("Upload complete",
                    session_id=session_id,
                    filename=filename,
@@ -128,39 +191,69 @@ class UploadService:
         Returns:
             List of uploaded file info
         """
-        session_dir = self.upload_dir / session_id
+        session_dir = self.session_path(session_id)
         if not session_dir.exists():
             raise ValueError(f"Invalid session: {session_id}")
         
+        streamed = self._read_checksum_sidecar(session_dir)
+        
         files = []
+        to_hash = []
         for path in session_dir.iterdir():
-            if path.is_file():
-                # Compute checksum
-                sha256 = hashlib.sha256()
-                with open(path, 'rb') as f:
-                    for chunk in iter(lambda: f.read(65536), b''):
-                        sha256.update(chunk)
-                
-                files.append({
-                    "filename": path.name,
-                    "path": str(path),
-                    "size": path.stat().st_size,
-                    "sha256": sha256.hexdigest(),
-                })
+            if not path.is_file() or path.name == CHECKSUM_SIDECAR:
+                continue
+            stat = path.stat()
+            entry = streamed.get(path.name)
+            # Trust the streamed checksum only while the file is untouched
+            if entry and (entry["size"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                checksum = entry["sha256"]
+            else:
+                checksum = None
+                to_hash.append(len(files))
+            files.append({
+                "filename": path.name,
+                "path": str(path),
+                "size": stat.st_size,
+                "sha256": checksum,
+            })
+        
+        if to_hash:
+            # Hash off the event loop, one file per worker thread
+            checksums = await asyncio.to_thread(
+                sha256_files, [Path(files[i]["path"]) for i in to_hash]
+            )
+            for i, checksum in zip(to_hash, checksums, strict=True):
+                files[i]["sha256"] = checksum
         
         logger.info("Session finalized", session_id=session_id, files=len(files))
         return files
     
+    @staticmethod
+    def _read_checksum_sidecar(session_dir: Path) -> dict[str, dict]:
+        """Streamed checksums by filename; later uploads of a name win."""
+        entries = {}
+        try:
+            with open(session_dir / CHECKSUM_SIDECAR, 'rb') as sidecar:
+                for line in sidecar:
+                    try:
+                        entry = orjson.loads(line)
+                        entries[entry["filename"]] = entry
+                    except (ValueError, KeyError):
+                        continue
+        except FileNotFoundError:
+            pass
+        return entries
+    
     async def cancel_session(self, session_id: str):
         """Cancel and clean up an upload session."""
-        session_dir = self.upload_dir / session_id
+        session_dir = self.session_path(session_id)
         if session_dir.exists():
             shutil.rmtree(session_dir)
             logger.info("Session cancelled", session_id=session_id)
     
     def get_file_path(self, session_id: str, filename: str) -> Path:
         """Get the path to an uploaded file."""
-        return self.upload_dir / session_id / filename
+        return self.session_path(session_id) / filename
 
     async def promote_session_to_run(self, session_id: str, run_id: str):
         """
@@ -168,8 +261,8 @@ class UploadService:
         
         Renames the session directory to the run ID.
         """
-        session_dir = self.upload_dir / session_id
-        run_dir = self.upload_dir / run_id
+        session_dir = self.session_path(session_id)
+        run_dir = self.session_path(run_id)
         
         if not session_dir.exists():
             raise ValueError(f"Upload session not found: {session_id}")
@@ -177,10 +270,23 @@ class UploadService:
         if run_dir.exists():
             # If run dir exists (e.g. from previous attempt), merge files
             for file_path in session_dir.iterdir():
-                if file_path.is_file():
-                    shutil.move(str(file_path), str(run_dir / file_path.name))
+                if file_path.name == CHECKSUM_SIDECAR:
+                    # Keep the earlier attempt's checksums; entries read
+                    # later win, so the session's own records take precedence
+                    with open(run_dir / CHECKSUM_SIDECAR, 'ab') as sidecar:
+                        sidecar.write(file_path.read_bytes())
+                elif file_path.is_file():
+                    try:
+                        # Same filesystem (the usual case): atomic rename
+                        os.replace(file_path, run_dir / file_path.name)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        # Cross-device: shutil copies with sendfile() on Linux
+                        shutil.move(str(file_path), str(run_dir / file_path.name))
             shutil.rmtree(session_dir)
         else:
+            run_dir.parent.mkdir(parents=True, exist_ok=True)
             session_dir.rename(run_dir)
             
         logger.info("Promoted upload session", session_id=session_id, run_id=run_id)
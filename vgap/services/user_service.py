@@ -4,21 +4,59 @@ VGAP User Service
 Database-backed user management with proper authentication.
 """
 
+import asyncio
+import time
 from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
 import structlog
 from passlib.context import CryptContext
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from vgap.config import get_settings
 from vgap.models import User, UserRole, AuditLog, AuditAction
 
 logger = structlog.get_logger()
+settings = get_settings()
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: new hashes use Argon2id; existing bcrypt hashes still
+# verify and are upgraded on the next successful login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=settings.security.argon2_time_cost,
+    argon2__memory_cost=settings.security.argon2_memory_cost,
+    argon2__parallelism=settings.security.argon2_parallelism,
+    bcrypt__rounds=settings.security.bcrypt_rounds,
+)
+
+
+# Recently seen unknown login emails -> expiry (monotonic seconds), so retry
+# storms against nonexistent accounts skip the database
+UNKNOWN_EMAIL_TTL = 5.0
+UNKNOWN_EMAIL_CACHE_SIZE = 10_000
+_unknown_emails: dict[str, float] = {}
+
+
+def _is_known_unknown(email: str) -> bool:
+    """Whether email was recently looked up and not found."""
+    expires = _unknown_emails.get(email)
+    if expires is None:
+        return False
+    if expires < time.monotonic():
+        del _unknown_emails[email]
+        return False
+    return True
+
+
+def _remember_unknown(email: str):
+    """Cache a failed email lookup, evicting the oldest entry when full."""
+    if len(_unknown_emails) >= UNKNOWN_EMAIL_CACHE_SIZE:
+        del _unknown_emails[next(iter(_unknown_emails))]
+    _unknown_emails[email] = time.monotonic() + UNKNOWN_EMAIL_TTL
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -26,6 +64,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str,
+) -> tuple[bool, Optional[str]]:
+    """Verify a password, returning a replacement hash if it is outdated."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def hash_password(password: str) -> str:
     """Hash a password for storage."""
     return pwd_context.hash(password)
@@ -67,15 +113,18 @@ async def create_user(
     user = User(
         id=uuid4(),
         email=email,
-        hashed_password=hash_password(password),
+        hashed_password=await asyncio.to_thread(hash_password, password),
         full_name=full_name,
         role=role,
         is_active=True,
         created_at=datetime.utcnow(),
     )
     
+    _unknown_emails.pop(email, None)
+    
+    # user.id is assigned client-side; the user and its audit entry go out
+    # together in the caller's commit instead of forcing a flush here
     session.add(user)
-    await session.flush()
     
     # Audit log
     if created_by:
@@ -127,24 +176,47 @@ async def authenticate_user(
     Returns:
         User object if authentication successful, None otherwise
     """
-    user = await get_user_by_email(session, email)
+    if _is_known_unknown(email):
+        logger.warning("Authentication failed: user not found", email=email)
+        return None
     
-    if not user:
+    # Only the columns needed to check credentials; the full row comes back
+    # from the last_login UPDATE below
+    result = await session.execute(
+        select(User.id, User.hashed_password, User.is_active).where(User.email == email)
+    )
+    credentials = result.one_or_none()
+    
+    if not credentials:
+        _remember_unknown(email)
         logger.warning("Authentication failed: user not found", email=email)
         return None
     
-    if not user.is_active:
+    if not credentials.is_active:
         logger.warning("Authentication failed: user deactivated", email=email)
         return None
     
-    if not verify_password(password, user.hashed_password):
+    # Password hashing takes tens of milliseconds; keep it off the event loop
+    verified, new_hash = await asyncio.to_thread(
+        verify_and_update_password, password, credentials.hashed_password
+    )
+    if not verified:
         logger.warning("Authentication failed: invalid password", email=email)
         return None
     
-    # Update last login
-    await session.execute(
-        update(User).where(User.id == user.id).values(last_login=datetime.utcnow())
+    # Update last login, upgrading a legacy hash in the same statement
+    update_data = {"last_login": datetime.utcnow()}
+    if new_hash:
+        update_data["hashed_password"] = new_hash
+        logger.info("Password hash upgraded", user_id=str(credentials.id))
+    
+    result = await session.execute(
+        update(User)
+        .where(User.id == credentials.id)
+        .values(**update_data)
+        .returning(User)
     )
+    user = result.scalar_one()
     
     logger.info("User authenticated", user_id=str(user.id), email=email)
     
@@ -169,19 +241,19 @@ async def update_user(
     Returns:
         Updated User object
     """
-    user = await get_user_by_id(session, user_id)
-    if not user:
-        return None
-    
     allowed_fields = {"full_name", "role", "is_active"}
     update_data = {k: v for k, v in kwargs.items() if k in allowed_fields}
     
     if not update_data:
-        return user
+        return await get_user_by_id(session, user_id)
     
-    await session.execute(
-        update(User).where(User.id == user_id).values(**update_data)
+    # RETURNING hands back the updated row; no row means no such user
+    result = await session.execute(
+        update(User).where(User.id == user_id).values(**update_data).returning(User)
     )
+    user = result.scalar_one_or_none()
+    if not user:
+        return None
     
     # Audit log
     audit = AuditLog(
@@ -197,7 +269,7 @@ async def update_user(
     
     logger.info("User updated", user_id=str(user_id), changes=update_data)
     
-    return await get_user_by_id(session, user_id)
+    return user
 
 
 async def deactivate_user(
@@ -216,13 +288,11 @@ async def deactivate_user(
     Returns:
         True if successful
     """
-    user = await get_user_by_id(session, user_id)
-    if not user:
-        return False
-    
-    await session.execute(
-        update(User).where(User.id == user_id).values(is_active=False)
+    result = await session.execute(
+        update(User).where(User.id == user_id).values(is_active=False).returning(User.id)
     )
+    if result.scalar_one_or_none() is None:
+        return False
     
     # Audit log
     audit = AuditLog(
@@ -263,14 +333,13 @@ async def change_password(
     if not user:
         return False
     
-    if not verify_password(old_password, user.hashed_password):
+    if not await asyncio.to_thread(verify_password, old_password, user.hashed_password):
         logger.warning("Password change failed: invalid old password", user_id=str(user_id))
         return False
     
+    new_hash = await asyncio.to_thread(hash_password, new_password)
     await session.execute(
-        update(User).where(User.id == user_id).values(
-            hashed_password=hash_password(new_password)
-        )
+        update(User).where(User.id == user_id).values(hashed_password=new_hash)
     )
     
     logger.info("Password changed", user_id=str(user_id))
@@ -296,25 +365,32 @@ async def list_users(
     Returns:
         Tuple of (users list, total count)
     """
-    query = select(User)
+    filters = []
     if active_only:
-        query = query.where(User.is_active == True)
-    
-    # Get total count
-    from sqlalchemy import func
-    count_query = select(func.count()).select_from(User)
-    if active_only:
-        count_query = count_query.where(User.is_active == True)
+        filters.append(User.is_active == True)
+    
+    # COUNT(*) OVER () returns the total alongside each page row
+    query = (
+        select(User, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(User.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    result = await session.execute(query)
+    rows = result.all()
     
-    total_result = await session.execute(count_query)
-    total = total_result.scalar()
+    if rows:
+        return [row.User for row in rows], rows[0].total
     
-    # Get paginated results
-    query = query.order_by(User.created_at.desc()).offset(skip).limit(limit)
-    result = await session.execute(query)
-    users = result.scalars().all()
+    if not skip:
+        return [], 0
     
-    return list(users), total
+    # Paged past the end: no row carries the window total
+    count_result = await session.execute(
+        select(func.count()).select_from(User).where(*filters)
+    )
+    return [], count_result.scalar()
 
 
 async def ensure_admin_exists(session: AsyncSession) -> User:
@@ -1,9 +1,10 @@
 from celery import shared_task
 import subprocess
-import json
 import logging
 from typing import Dict, Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 @shared_task(bind=True, name="vgap.tasks.maintenance.prune_docker")
@@ -81,13 +82,11 @@ def scan_docker_usage(self) -> Dict[str, Any]:
         proc = subprocess.run(
             ["docker", "system", "df", "--format", "{{json .}}"],
             capture_output=True,
-            text=True,
             check=True
         )
         # Docker output might be multiple JSON objects separated by newlines
-        # We need to parse them.
-        output = proc.stdout.strip().split('\n')
-        parsed = [json.loads(line) for line in output if line]
+        # orjson parses the raw bytes, so stdout is never decoded to str
+        parsed = [orjson.loads(line) for line in proc.stdout.splitlines() if line.strip()]
         
         return {"usage": parsed, "success": True}
     except Exception as e:
@@ -0,0 +1,16 @@
+"""
+VGAP Primer Scheme Names
+
+Canonical spelling of primer scheme names, shared by pre-flight validation,
+the runs API and the reference manager.
+"""
+
+import re
+
+# Underscores and whitespace in user-supplied scheme names are read as "-"
+_SCHEME_SEPARATOR_RE = re.compile(r"[_\s]+")
+
+
+def normalize_scheme_name(name: str) -> str:
+    """Canonicalize a primer scheme name, e.g. "artic_v4.1" -> "ARTIC-V4.1"."""
+    return _SCHEME_SEPARATOR_RE.sub("-", name.strip()).upper()
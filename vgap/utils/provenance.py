@@ -3,13 +3,41 @@ VGAP Provenance Module - Track all inputs, outputs, and parameters.
 """
 
 import hashlib
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 from uuid import UUID, uuid4
 
+import orjson
+
+# Large reads keep OpenSSL's SHA-256 (SHA-NI where the CPU has it) busy
+# instead of paying per-call overhead every 64 KiB
+CHECKSUM_CHUNK_SIZE = 1 << 20
+
+
+def sha256_file(path: Path) -> str:
+    """Compute SHA256 checksum of a file."""
+    sha256 = hashlib.sha256()
+    buf = bytearray(CHECKSUM_CHUNK_SIZE)
+    view = memoryview(buf)
+    with open(path, 'rb', buffering=0) as f:
+        while n := f.readinto(buf):
+            sha256.update(view[:n])
+    return sha256.hexdigest()
+
+
+def sha256_files(paths: list[Path]) -> list[str]:
+    """Checksum several files at once, returning digests in input order."""
+    if len(paths) <= 1:
+        return [sha256_file(path) for path in paths]
+    # hashlib releases the GIL while hashing, so threads hash files in parallel
+    workers = min(len(paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(sha256_file, paths))
+
 
 @dataclass
 class ProvenanceCollector:
@@ -28,6 +56,11 @@ class ProvenanceCollector:
     outputs: dict[str, str] = field(default_factory=dict)
     validation_status: dict[str, str] = field(default_factory=dict)
     
+    # Name -> entry in self.software, so re-registering a tool is O(1)
+    _software_index: dict[str, dict[str, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
     def add_input_file(self, path: Path, category: str = "input"):
         """Record an input file with checksum."""
         if path.exists():
@@ -54,12 +87,13 @@ class ProvenanceCollector:
             entry["container"] = container
         
         # Avoid duplicates
-        for s in self.software:
-            if s["name"] == name:
-                s.update(entry)
-                return
+        existing = self._software_index.get(name)
+        if existing is not None:
+            existing.update(entry)
+            return
         
         self.software.append(entry)
+        self._software_index[name] = entry
     
     def add_database(self, name: str, version: str, checksum: str = ""):
         """Record database version."""
@@ -93,11 +127,7 @@ class ProvenanceCollector:
     
     def _compute_checksum(self, path: Path) -> str:
         """Compute SHA256 checksum."""
-        sha256 = hashlib.sha256()
-        with open(path, 'rb') as f:
-            for chunk in iter(lambda: f.read(65536), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return sha256_file(path)
     
     def to_dict(self) -> dict[str, Any]:
         """Export provenance as dictionary."""
@@ -117,14 +147,17 @@ class ProvenanceCollector:
     
     def save(self, path: Path):
         """Save provenance to JSON file."""
-        with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                self.to_dict(),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ))
     
     @classmethod
     def load(cls, path: Path) -> "ProvenanceCollector":
         """Load provenance from JSON file."""
-        with open(path) as f:
-            data = json.load(f)
+        with open(path, 'rb') as f:
+            data = orjson.loads(f.read())
         
         p = cls()
         p.run_id = UUID(data["run_id"])
@@ -133,6 +166,7 @@ class ProvenanceCollector:
         p.inputs = data.get("inputs", {})
         p.parameters = data.get("parameters", {})
         p.software = data.get("software", [])
+        p._software_index = {s["name"]: s for s in p.software}
         p.databases = data.get("databases", [])
         p.commands = data.get("commands", [])
         p.random_seeds = data.get("random_seeds", {})
@@ -145,16 +179,15 @@ def generate_checksums_file(output_dir: Path) -> Path:
     """Generate checksums.txt for all output files."""
     checksums_path = output_dir / "checksums.txt"
     
+    paths = [
+        path for path in sorted(output_dir.rglob("*"))
+        if path.is_file() and path != checksums_path
+    ]
+    
     with open(checksums_path, 'w') as f:
-        for path in sorted(output_dir.rglob("*")):
-            if path.is_file() and path != checksums_path:
-                sha256 = hashlib.sha256()
-                with open(path, 'rb') as pf:
-                    for chunk in iter(lambda: pf.read(65536), b''):
-                        sha256.update(chunk)
-                
-                rel_path = path.relative_to(output_dir)
-                f.write(f"{sha256.hexdigest()}  {rel_path}\n")
+        for path, checksum in zip(paths, sha256_files(paths), strict=True):
+            rel_path = path.relative_to(output_dir)
+            f.write(f"{checksum}  {rel_path}\n")
     
     return checksums_path
 
@@ -165,26 +198,25 @@ def verify_checksums(output_dir: Path) -> tuple[bool, list[str]]:
     if not checksums_path.exists():
         return False, ["checksums.txt not found"]
     
-    errors = []
+    entries = []
     with open(checksums_path) as f:
         for line in f:
             parts = line.strip().split("  ", 1)
-            if len(parts) != 2:
-                continue
-            
-            expected, rel_path = parts
-            path = output_dir / rel_path
-            
-            if not path.exists():
-                errors.append(f"Missing: {rel_path}")
-                continue
-            
-            sha256 = hashlib.sha256()
-            with open(path, 'rb') as pf:
-                for chunk in iter(lambda: pf.read(65536), b''):
-                    sha256.update(chunk)
-            
-            if sha256.hexdigest() != expected:
-                errors.append(f"Mismatch: {rel_path}")
+            if len(parts) == 2:
+                entries.append(parts)
+    
+    present = [
+        output_dir / rel_path for _, rel_path in entries
+        if (output_dir / rel_path).exists()
+    ]
+    actual = dict(zip(present, sha256_files(present), strict=True))
+    
+    errors = []
+    for expected, rel_path in entries:
+        path = output_dir / rel_path
+        if path not in actual:
+            errors.append(f"Missing: {rel_path}")
+        elif actual[path] != expected:
+            errors.append(f"Mismatch: {rel_path}")
     
     return len(errors) == 0, errors
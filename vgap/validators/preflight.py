@@ -5,18 +5,263 @@ Implements mandatory hard guards for input validation before pipeline execution.
 All validation failures block the run with deterministic error messages.
 """
 
-import gzip
 import hashlib
+import mmap
+import os
 import re
+import stat
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
+from functools import partial
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
 
+import numpy as np
+import orjson
 import structlog
 
+from vgap.utils.primer_schemes import normalize_scheme_name
+
 logger = structlog.get_logger()
 
+# ISA-L's igzip is a drop-in gzip replacement with SIMD-accelerated inflate
+# and CRC32; fall back to the stdlib module when it is not installed.
+try:
+    from isal import igzip as _gzip
+    from isal import isal_zlib as _zlib
+    ISAL_AVAILABLE = True
+except ImportError:
+    import gzip as _gzip
+    import zlib as _zlib
+    ISAL_AVAILABLE = False
+
+# rapidgzip decompresses a single gzip stream on all cores; used for the full
+# gzip test of large files when installed.
+try:
+    import rapidgzip
+    RAPIDGZIP_AVAILABLE = True
+except ImportError:
+    RAPIDGZIP_AVAILABLE = False
+
+# Below this size the thread start-up of parallel decompression outweighs it
+RAPIDGZIP_MIN_SIZE = 64 << 20
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+# A gzip member is at least a 10-byte header plus the 8-byte CRC32/ISIZE
+# trailer.
+_GZIP_HEADER_SIZE = 10
+_GZIP_TRAILER = struct.Struct('<II')
+
+# Compressed bytes read, and decompressed bytes produced, per step of the
+# streaming gzip test.
+GZIP_TEST_CHUNK_SIZE = 1 << 20
+
+
+class _GzipStream:
+    """Incremental inflater for gzip data that may hold several members."""
+    
+    def __init__(self):
+        self._decomp = _zlib.decompressobj(wbits=31)
+        self._in_member = False
+    
+    def feed(self, chunk: bytes, keep: bool = True) -> bytes:
+        """Inflate a chunk of compressed data, returning it if keep is set.
+
+        Output is produced at most GZIP_TEST_CHUNK_SIZE bytes at a time, so
+        with keep=False memory stays bounded however well the data packs.
+        """
+        out = []
+        while chunk:
+            self._in_member = True
+            decomp = self._decomp
+            try:
+                data = decomp.decompress(chunk, GZIP_TEST_CHUNK_SIZE)
+                while True:
+                    if keep:
+                        out.append(data)
+                    if not decomp.unconsumed_tail:
+                        break
+                    data = decomp.decompress(decomp.unconsumed_tail, GZIP_TEST_CHUNK_SIZE)
+            except _zlib.error as e:
+                raise _gzip.BadGzipFile(str(e)) from e
+            if not decomp.eof:
+                break
+            # Concatenated members (e.g. bgzip output) follow the trailer
+            chunk = decomp.unused_data
+            self._decomp = _zlib.decompressobj(wbits=31)
+            self._in_member = False
+        return b''.join(out)
+    
+    def close(self) -> None:
+        """Raise BadGzipFile if the input stopped in the middle of a member."""
+        if self._in_member and not self._decomp.eof:
+            raise _gzip.BadGzipFile("Compressed file ended before the end-of-stream marker")
+
+
+def _is_gzipped(path: Path) -> bool:
+    """Sniff the gzip magic bytes rather than trusting the .gz extension."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(2) == _GZIP_MAGIC
+    except OSError:
+        return False  # Reported by whichever check opens the file next
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    """Stat a path; None if it does not exist."""
+    try:
+        return path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+# Concurrent stat calls when prefetching the paths of a run
+STAT_BATCH_SIZE = 32
+
+
+def _batch_stat(paths: Iterable[Path]) -> dict[Path, Optional[os.stat_result]]:
+    """Stat many paths at once.
+
+    On network filesystems each stat waits on a server round trip; a small
+    thread pool overlaps those waits instead of paying them one by one.
+    """
+    unique = list(dict.fromkeys(paths))
+    if len(unique) <= 1:
+        return {path: _stat(path) for path in unique}
+    with ThreadPoolExecutor(max_workers=min(len(unique), STAT_BATCH_SIZE)) as executor:
+        return dict(zip(unique, executor.map(_stat, unique), strict=True))
+
+
+def _fadvise(f, advice: str) -> None:
+    """Pass a POSIX_FADV_* hint for the whole file, where supported."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+        except OSError:
+            pass  # Only a hint; some filesystems reject it
+
+
+def _advise_sequential(f) -> None:
+    """Tell the kernel a whole-file read is coming so it reads ahead deeply."""
+    _fadvise(f, 'POSIX_FADV_SEQUENTIAL')
+
+
+def _advise_done(f) -> None:
+    """Drop a fully read file from the page cache.
+
+    Each FASTQ is read once per run, so keeping its pages cached only evicts
+    data that later samples in the run still need.
+    """
+    _fadvise(f, 'POSIX_FADV_DONTNEED')
+
+
+def _gzip_test(path: Path, threads: Optional[int] = None) -> None:
+    """Verify every member of a gzip file, like ``gzip -t``.
+
+    Inflates the whole stream and discards the output, so the CRC32 and
+    ISIZE trailers of each member are checked without holding more than one
+    chunk of decompressed data. Large files are inflated by rapidgzip on
+    threads (default: all cores). Raises BadGzipFile on corruption or
+    truncation.
+    """
+    if RAPIDGZIP_AVAILABLE and path.stat().st_size >= RAPIDGZIP_MIN_SIZE:
+        try:
+            with rapidgzip.open(str(path), parallelization=threads or os.cpu_count() or 1) as f:
+                while f.read(GZIP_TEST_CHUNK_SIZE):
+                    pass
+        except (OSError, RuntimeError, ValueError) as e:
+            raise _gzip.BadGzipFile(str(e)) from e
+        return
+    
+    stream = _GzipStream()
+    with open(path, 'rb', buffering=0) as f:
+        _advise_sequential(f)
+        while chunk := f.read(GZIP_TEST_CHUNK_SIZE):
+            stream.feed(chunk, keep=False)
+        _advise_done(f)
+    stream.close()
+
+
+def _split_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield the lines of a stream of byte chunks, without terminators."""
+    pending = b''
+    for chunk in chunks:
+        if not chunk:
+            continue
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+def _stripped_len(line: bytes) -> int:
+    """Length of a line minus its LF or CRLF terminator, without copying it."""
+    n = len(line)
+    if n and line[n - 1] == 0x0A:
+        n -= 1
+    if n and line[n - 1] == 0x0D:
+        n -= 1
+    return n
+
+
+# Block size for the header scan in paired-read validation
+HEADER_SCAN_BLOCK_SIZE = 64 * 1024
+
+
+def _iter_headers(f) -> Iterator[bytes]:
+    """Yield the header line (first of every four) of a binary FASTQ stream.
+
+    Reads in blocks and finds newlines with bytes.find, so the sequence,
+    separator and quality lines are skipped without a readline call each.
+    Headers are yielded without their line terminator.
+    """
+    buf = b''
+    line_num = 0
+    while block := f.read(HEADER_SCAN_BLOCK_SIZE):
+        buf += block
+        pos = 0
+        while (end := buf.find(b'\n', pos)) != -1:
+            if line_num % 4 == 0:
+                yield buf[pos:end]
+            line_num += 1
+            pos = end + 1
+        buf = buf[pos:]
+    if buf and line_num % 4 == 0:
+        yield buf
+
+
+def _last_header(path: Path) -> Optional[bytes]:
+    """Return the header of the last record of an uncompressed FASTQ file.
+
+    Only the final HEADER_SCAN_BLOCK_SIZE bytes are read. Returns None when
+    the tail does not end in a well-formed record.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        f.seek(max(0, size - HEADER_SCAN_BLOCK_SIZE))
+        lines = f.read().rstrip(b'\r\n').split(b'\n')
+    if len(lines) < 4 or not lines[-4].startswith(b'@') or not lines[-2].startswith(b'+'):
+        return None
+    return lines[-4].rstrip(b'\r')
+
+
+# Safe filename: alphanumeric, underscores, hyphens, periods. \Z rather than
+# $ so a trailing newline is not accepted.
+_SAFE_FILENAME_RE = re.compile(r'^[\w\-\.]+\Z')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}\Z')
+
+# Read ID from a FASTQ header: the first token after '@', minus an Illumina
+# /1 or /2 pair suffix.
+_READ_ID_RE = re.compile(rb'@*\s*(\S*?)(?:/[12])?(?=\s|\Z)')
+
 
 class ValidationStatus(str, Enum):
     """Validation result status."""
@@ -25,6 +270,14 @@ class ValidationStatus(str, Enum):
     WARNING = "warning"
 
 
+# Severity order used when combining results: FAIL > WARNING > PASS
+_STATUS_RANK = {
+    ValidationStatus.PASS: 0,
+    ValidationStatus.WARNING: 1,
+    ValidationStatus.FAIL: 2,
+}
+
+
 class ValidationErrorCode(str, Enum):
     """Standardized error codes for validation failures."""
     # FASTQ Errors
@@ -58,7 +311,7 @@ class ValidationErrorCode(str, Enum):
     FILE_TOO_LARGE = "FILE_TOO_LARGE"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationError:
     """A single validation error with remediation guidance."""
     code: ValidationErrorCode
@@ -77,7 +330,7 @@ class ValidationError:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationWarning:
     """A validation warning (non-blocking)."""
     code: str
@@ -94,7 +347,7 @@ class ValidationWarning:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Complete validation result for a pre-flight check."""
     status: ValidationStatus
@@ -116,19 +369,14 @@ class ValidationResult:
     
     def add_warning(self, warning: ValidationWarning) -> None:
         self.warnings.append(warning)
-        if self.status == ValidationStatus.PASS:
-            self.status = ValidationStatus.WARNING
+        self.status = max(self.status, ValidationStatus.WARNING, key=_STATUS_RANK.__getitem__)
     
     def merge(self, other: "ValidationResult") -> None:
         """Merge another validation result into this one."""
         self.errors.extend(other.errors)
         self.warnings.extend(other.warnings)
         self.metadata.update(other.metadata)
-        
-        if other.status == ValidationStatus.FAIL:
-            self.status = ValidationStatus.FAIL
-        elif other.status == ValidationStatus.WARNING and self.status == ValidationStatus.PASS:
-            self.status = ValidationStatus.WARNING
+        self.status = max(self.status, other.status, key=_STATUS_RANK.__getitem__)
     
     def to_dict(self) -> dict:
         return {
@@ -137,16 +385,59 @@ class ValidationResult:
             "warnings": [w.to_dict() for w in self.warnings],
             "metadata": self.metadata,
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to_dict() as JSON without building the dict tree.
 
+        orjson walks the dataclass fields and enum values natively; the field
+        names of ValidationError and ValidationWarning match their to_dict keys.
+        """
+        return orjson.dumps(self, default=str, option=orjson.OPT_NON_STR_KEYS)
 
-class FASTQValidator:
-    """Validates FASTQ file format and integrity."""
+
+@dataclass(slots=True)
+class ValidationContext:
+    """Per-run state shared by the validators.
+
+    Holds one stat per path, plus the results of run-wide checks (such as
+    the primer scheme) that every sample would otherwise repeat.
+    """
+    stat_cache: dict[Path, Optional[os.stat_result]] = field(default_factory=dict)
+    check_cache: dict[tuple, ValidationResult] = field(default_factory=dict)
+    # Decompression threads per file; set to a share of the cores when files
+    # are validated concurrently, None for all of them
+    decode_threads: Optional[int] = None
+    _check_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    
+    def stat(self, path: Path) -> Optional[os.stat_result]:
+        """Stat a path on first use; None if it does not exist."""
+        try:
+            return self.stat_cache[path]
+        except KeyError:
+            st = self.stat_cache[path] = _stat(path)
+            return st
     
-    # Safe filename pattern: alphanumeric, underscores, hyphens, periods
-    SAFE_FILENAME_PATTERN = re.compile(r'^[\w\-\.]+$')
+    def cached_check(self, key: tuple, check: Callable[[], ValidationResult]) -> ValidationResult:
+        """Run a check once per key and reuse its result afterwards."""
+        # Samples are validated on a thread pool; the lock keeps the first
+        # sample to reach a check from racing the others through it
+        with self._check_lock:
+            result = self.check_cache.get(key)
+            if result is None:
+                result = self.check_cache[key] = check()
+            return result
     
-    # FASTQ header pattern
-    FASTQ_HEADER_PATTERN = re.compile(r'^@[\w\-\.:\s/]+$')
+    def prefetch(self, paths: Iterable[Path]) -> None:
+        """Stat the given paths in one concurrent batch."""
+        self.stat_cache.update(
+            _batch_stat(path for path in paths if path not in self.stat_cache)
+        )
+
+
+class FASTQValidator:
+    """Validates FASTQ file format and integrity."""
     
     def __init__(self, max_file_size_gb: float = 20.0):
         self.max_file_size_bytes = int(max_file_size_gb * 1024 * 1024 * 1024)
@@ -155,7 +446,7 @@ class FASTQValidator:
         """Check filename for unsafe characters."""
         result = ValidationResult(status=ValidationStatus.PASS)
         
-        if not self.SAFE_FILENAME_PATTERN.match(path.name):
+        if not _SAFE_FILENAME_RE.match(path.name):
             result.add_error(ValidationError(
                 code=ValidationErrorCode.UNSAFE_FILENAME,
                 message=f"Filename contains unsafe characters: {path.name}",
@@ -168,16 +459,21 @@ class FASTQValidator:
     
     def validate_file_exists(self, path: Path) -> ValidationResult:
         """Check that file exists and is readable."""
+        return self._validate_file_exists(path, _stat(path))
+    
+    def _validate_file_exists(
+        self, path: Path, st: Optional[os.stat_result]
+    ) -> ValidationResult:
         result = ValidationResult(status=ValidationStatus.PASS)
         
-        if not path.exists():
+        if st is None:
             result.add_error(ValidationError(
                 code=ValidationErrorCode.FASTQ_NOT_FOUND,
                 message=f"FASTQ file not found: {path}",
                 field="file_path",
                 remediation="Ensure the file exists and the path is correct."
             ))
-        elif not path.is_file():
+        elif not stat.S_ISREG(st.st_mode):
             result.add_error(ValidationError(
                 code=ValidationErrorCode.FASTQ_NOT_FOUND,
                 message=f"Path is not a file: {path}",
@@ -189,10 +485,15 @@ class FASTQValidator:
     
     def validate_file_size(self, path: Path) -> ValidationResult:
         """Check file size is within limits."""
+        return self._validate_file_size(path, _stat(path))
+    
+    def _validate_file_size(
+        self, path: Path, st: Optional[os.stat_result]
+    ) -> ValidationResult:
         result = ValidationResult(status=ValidationStatus.PASS)
         
-        if path.exists():
-            size = path.stat().st_size
+        if st is not None:
+            size = st.st_size
             result.metadata["file_size_bytes"] = size
             
             if size == 0:
@@ -213,27 +514,48 @@ class FASTQValidator:
         
         return result
     
-    def validate_gzip_integrity(self, path: Path, sample_size: int = 1024 * 1024) -> ValidationResult:
-        """Check gzip file integrity by reading first and last portions."""
+    def validate_gzip_integrity(
+        self,
+        path: Path,
+        sample_size: int = 1024 * 1024,
+        fast_integrity_check: bool = False,
+        gzipped: Optional[bool] = None,
+        decode_threads: Optional[int] = None,
+    ) -> ValidationResult:
+        """Check gzip file integrity.
+
+        By default decompresses the first sample_size bytes and reads the raw
+        gzip trailer at the end of the file. With fast_integrity_check the
+        whole stream is verified against its CRC32 trailers without keeping
+        the decompressed data, inflating on up to decode_threads threads.
+        """
         result = ValidationResult(status=ValidationStatus.PASS)
         
-        if not path.name.endswith('.gz'):
+        if gzipped is None:
+            gzipped = _is_gzipped(path)
+        if not gzipped:
             return result  # Not gzipped, skip this check
         
         try:
-            with gzip.open(path, 'rt') as f:
+            if fast_integrity_check:
+                _gzip_test(path, decode_threads)
+                return result
+            
+            with _gzip.open(path, 'rb') as f:
                 # Read beginning
                 f.read(sample_size)
-                
-                # Try to seek to end (may fail on corrupted files)
-                try:
-                    f.seek(-sample_size, 2)  # Seek from end
-                    f.read(sample_size)
-                except OSError:
-                    # Some gzip files don't support seeking, read sequentially
-                    pass
+            
+            # Read the trailer straight from the compressed bytes; seeking the
+            # decompressed stream from the end would inflate the whole file
+            with open(path, 'rb') as f:
+                if f.seek(0, 2) < _GZIP_HEADER_SIZE + _GZIP_TRAILER.size:
+                    raise _gzip.BadGzipFile("File too short to hold a gzip trailer")
+                f.seek(-_GZIP_TRAILER.size, 2)
+                _, isize = _GZIP_TRAILER.unpack(f.read(_GZIP_TRAILER.size))
+            # Uncompressed size mod 2**32 (of the last member)
+            result.metadata["gzip_isize"] = isize
                     
-        except gzip.BadGzipFile:
+        except _gzip.BadGzipFile:
             result.add_error(ValidationError(
                 code=ValidationErrorCode.FASTQ_CORRUPT_GZIP,
                 message=f"Corrupt gzip file: {path}",
@@ -251,76 +573,88 @@ class FASTQValidator:
         
         return result
     
+    def _check_records(
+        self,
+        lines: Iterable[bytes],
+        num_records: int,
+        result: ValidationResult,
+    ) -> None:
+        """Check the first num_records FASTQ records of a stream of lines.
+
+        The sampled records are sliced into header/sequence/separator/quality
+        columns and checked column-wise, so the per-record work runs in C-level
+        ``map`` calls and NumPy comparisons instead of an interpreted loop.
+        """
+        block = list(islice(lines, 4 * num_records))
+        if not block:
+            return
+        # A truncated final record reads as empty lines
+        block += [b''] * (-len(block) % 4)
+        headers, sequences, pluses, qualities = (block[i::4] for i in range(4))
+        n = len(headers)
+        
+        header_ok = np.fromiter(map(bytes.startswith, headers, repeat(b'@')), dtype=bool, count=n)
+        plus_ok = np.fromiter(map(bytes.startswith, pluses, repeat(b'+')), dtype=bool, count=n)
+        seq_lens = np.fromiter(map(_stripped_len, sequences), dtype=np.int64, count=n)
+        qual_lens = np.fromiter(map(_stripped_len, qualities), dtype=np.int64, count=n)
+        
+        # Index of the first bad record; everything before it is valid
+        bad = ~(header_ok & plus_ok & (seq_lens == qual_lens))
+        valid = int(bad.argmax()) if bad.any() else n
+        
+        if valid < n:
+            line_num = 4 * (valid + 1)
+            if not header_ok[valid]:
+                snippet = headers[valid][:50].decode('utf-8', 'replace')
+                result.add_error(ValidationError(
+                    code=ValidationErrorCode.FASTQ_INVALID_FORMAT,
+                    message=f"Invalid FASTQ header at line {line_num - 3}: {snippet}",
+                    field="fastq_format",
+                    remediation="FASTQ headers must start with '@'."
+                ))
+            elif not plus_ok[valid]:
+                result.add_error(ValidationError(
+                    code=ValidationErrorCode.FASTQ_INVALID_FORMAT,
+                    message=f"Invalid FASTQ separator at line {line_num - 1}",
+                    field="fastq_format",
+                    remediation="FASTQ quality header must start with '+'."
+                ))
+            else:
+                result.add_error(ValidationError(
+                    code=ValidationErrorCode.FASTQ_INVALID_FORMAT,
+                    message=f"Sequence/quality length mismatch at line {line_num - 2}: "
+                           f"{seq_lens[valid]} vs {qual_lens[valid]}",
+                    field="fastq_format",
+                    remediation="Each sequence must have equal length quality string."
+                ))
+        
+        # Store read length statistics
+        if valid:
+            read_lengths = seq_lens[:valid]
+            result.metadata["read_count_sampled"] = valid
+            result.metadata["read_length_min"] = int(read_lengths.min())
+            result.metadata["read_length_max"] = int(read_lengths.max())
+            result.metadata["read_length_mean"] = float(read_lengths.mean())
+    
     def validate_fastq_format(
         self,
         path: Path,
-        num_records: int = 1000
+        num_records: int = 1000,
+        gzipped: Optional[bool] = None,
     ) -> ValidationResult:
         """Validate FASTQ format by checking first N records."""
         result = ValidationResult(status=ValidationStatus.PASS)
         
+        if gzipped is None:
+            gzipped = _is_gzipped(path)
+        
         try:
-            opener = gzip.open if path.name.endswith('.gz') else open
-            read_lengths = []
-            record_count = 0
-            
-            with opener(path, 'rt') as f:
-                line_num = 0
-                while record_count < num_records:
-                    # Read 4 lines (one FASTQ record)
-                    header = f.readline()
-                    if not header:
-                        break  # EOF
-                    
-                    sequence = f.readline()
-                    plus = f.readline()
-                    quality = f.readline()
-                    
-                    line_num += 4
-                    
-                    # Validate header
-                    if not header.startswith('@'):
-                        result.add_error(ValidationError(
-                            code=ValidationErrorCode.FASTQ_INVALID_FORMAT,
-                            message=f"Invalid FASTQ header at line {line_num - 3}: {header[:50]}",
-                            field="fastq_format",
-                            remediation="FASTQ headers must start with '@'."
-                        ))
-                        break
-                    
-                    # Validate plus line
-                    if not plus.startswith('+'):
-                        result.add_error(ValidationError(
-                            code=ValidationErrorCode.FASTQ_INVALID_FORMAT,
-                            message=f"Invalid FASTQ separator at line {line_num - 1}",
-                            field="fastq_format",
-                            remediation="FASTQ quality header must start with '+'."
-                        ))
-                        break
-                    
-                    # Validate sequence/quality length match
-                    seq_len = len(sequence.strip())
-                    qual_len = len(quality.strip())
-                    
-                    if seq_len != qual_len:
-                        result.add_error(ValidationError(
-                            code=ValidationErrorCode.FASTQ_INVALID_FORMAT,
-                            message=f"Sequence/quality length mismatch at line {line_num - 2}: "
-                                   f"{seq_len} vs {qual_len}",
-                            field="fastq_format",
-                            remediation="Each sequence must have equal length quality string."
-                        ))
-                        break
-                    
-                    read_lengths.append(seq_len)
-                    record_count += 1
+            opener = _gzip.open if gzipped else open
             
-            # Store read length statistics
-            if read_lengths:
-                result.metadata["read_count_sampled"] = len(read_lengths)
-                result.metadata["read_length_min"] = min(read_lengths)
-                result.metadata["read_length_max"] = max(read_lengths)
-                result.metadata["read_length_mean"] = sum(read_lengths) / len(read_lengths)
+            # Binary mode: the checks below only need prefixes and lengths, so
+            # skip the UTF-8 decode and decode the header only for errors.
+            with opener(path, 'rb') as f:
+                self._check_records(f, num_records, result)
                 
         except Exception as e:
             result.add_error(ValidationError(
@@ -334,59 +668,194 @@ class FASTQValidator:
     
     def compute_checksum(self, path: Path) -> str:
         """Compute SHA256 checksum for file."""
+        # file_digest feeds OpenSSL from a reused buffer on an unbuffered file
+        with open(path, 'rb', buffering=0) as f:
+            _advise_sequential(f)
+            digest = hashlib.file_digest(f, 'sha256').hexdigest()
+            _advise_done(f)
+            return digest
+    
+    def validate_file_streaming(
+        self,
+        path: Path,
+        num_records: int = 1000,
+        gzipped: Optional[bool] = None,
+    ) -> ValidationResult:
+        """Check gzip integrity, FASTQ format and SHA256 in one read of the file.
+
+        Raw chunks feed the hasher and, for gzip files, an inflater whose output
+        is split into lines for the first num_records records. The rest of the
+        file is only hashed, not inflated; its gzip trailer is read from the
+        raw bytes as in validate_gzip_integrity. When the sampled records reach
+        the end of the file, every member's CRC has been checked as well.
+        """
+        result = ValidationResult(status=ValidationStatus.PASS)
         sha256 = hashlib.sha256()
-        with open(path, 'rb') as f:
-            for chunk in iter(lambda: f.read(65536), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        if gzipped is None:
+            gzipped = _is_gzipped(path)
+        stream = _GzipStream() if gzipped else None
+        tail = b''
+        
+        try:
+            with open(path, 'rb', buffering=0) as f:
+                _advise_sequential(f)
+                
+                def read_chunk(inflate: bool = True) -> Optional[bytes]:
+                    nonlocal tail
+                    raw = f.read(GZIP_TEST_CHUNK_SIZE)
+                    if not raw:
+                        return None
+                    sha256.update(raw)
+                    # Keep the last trailer-sized bytes without copying chunks
+                    if len(raw) >= _GZIP_TRAILER.size:
+                        tail = raw[-_GZIP_TRAILER.size:]
+                    else:
+                        tail = (tail + raw)[-_GZIP_TRAILER.size:]
+                    return stream.feed(raw, keep=True) if stream and inflate else raw
+                
+                self._check_records(
+                    _split_lines(iter(read_chunk, None)), num_records, result
+                )
+                if result.blocked:
+                    return result
+                
+                # Past the sample only the hash needs the bytes
+                inflated_all = True
+                while read_chunk(inflate=False) is not None:
+                    inflated_all = False
+                _advise_done(f)
+                size = f.tell()
+            
+            if stream:
+                if inflated_all:
+                    stream.close()
+                elif size < _GZIP_HEADER_SIZE + _GZIP_TRAILER.size:
+                    raise _gzip.BadGzipFile("File too short to hold a gzip trailer")
+                # Uncompressed size mod 2**32 (of the last member)
+                result.metadata["gzip_isize"] = _GZIP_TRAILER.unpack(tail)[1]
+                
+        except _gzip.BadGzipFile:
+            result.add_error(ValidationError(
+                code=ValidationErrorCode.FASTQ_CORRUPT_GZIP,
+                message=f"Corrupt gzip file: {path}",
+                field="gzip_integrity",
+                remediation="Re-download or re-transfer the file. "
+                           "Verify with: gzip -t {path}"
+            ))
+            return result
+        except Exception as e:
+            result.add_error(ValidationError(
+                code=ValidationErrorCode.FASTQ_INVALID_FORMAT,
+                message=f"Error parsing FASTQ file {path}: {str(e)}",
+                field="fastq_format",
+                remediation="Verify the file is a valid FASTQ format."
+            ))
+            return result
+        
+        result.metadata["sha256"] = sha256.hexdigest()
+        return result
     
-    def validate_file(self, path: Path, compute_checksum: bool = True) -> ValidationResult:
-        """Run all file-level validations."""
+    def validate_file(
+        self,
+        path: Path,
+        compute_checksum: bool = True,
+        fast_integrity_check: bool = False,
+        ctx: Optional[ValidationContext] = None,
+    ) -> ValidationResult:
+        """Run all file-level validations.
+
+        Gzip files are checked from a sample and their trailer unless
+        fast_integrity_check is set, which also verifies every member's CRC
+        by inflating the whole file. With a ctx, the stat of path comes from
+        (and is kept in) its cache.
+        """
         result = ValidationResult(status=ValidationStatus.PASS)
         
         # Filename check
         result.merge(self.validate_filename(path))
         
+        # Existence and size checks share a single stat
+        st = ctx.stat(path) if ctx else _stat(path)
+        
         # Existence check
-        result.merge(self.validate_file_exists(path))
+        result.merge(self._validate_file_exists(path, st))
         if result.blocked:
             return result
         
         # Size check
-        result.merge(self.validate_file_size(path))
+        result.merge(self._validate_file_size(path, st))
         if result.blocked:
             return result
         
+        # Detect compression once, from the content rather than the name
+        gzipped = _is_gzipped(path)
+        result.metadata["gzipped"] = gzipped
+        
+        # The checksum reads the whole file anyway, so check the gzip trailer
+        # and FASTQ format from the same pass
+        if compute_checksum:
+            result.merge(self.validate_file_streaming(path, gzipped=gzipped))
+            if fast_integrity_check and gzipped and not result.blocked:
+                # Opt-in full CRC check; the streaming pass only inflates the
+                # sampled records
+                result.merge(self.validate_gzip_integrity(
+                    path,
+                    fast_integrity_check=True,
+                    gzipped=True,
+                    decode_threads=ctx.decode_threads if ctx else None,
+                ))
+            return result
+        
         # Gzip integrity
-        result.merge(self.validate_gzip_integrity(path))
+        result.merge(self.validate_gzip_integrity(
+            path,
+            fast_integrity_check=fast_integrity_check,
+            gzipped=gzipped,
+            decode_threads=ctx.decode_threads if ctx else None,
+        ))
         if result.blocked:
             return result
         
         # FASTQ format
-        result.merge(self.validate_fastq_format(path))
-        
-        # Compute checksum if requested
-        if compute_checksum and not result.blocked:
-            result.metadata["sha256"] = self.compute_checksum(path)
+        result.merge(self.validate_fastq_format(path, gzipped=gzipped))
         
         return result
+    
+    def validate_files(
+        self,
+        paths: list[Path],
+        compute_checksum: bool = True,
+    ) -> list[ValidationResult]:
+        """Run validate_file on several files at once, in input order."""
+        if len(paths) <= 1:
+            return [self.validate_file(path, compute_checksum) for path in paths]
+        # hashlib and zlib release the GIL on large buffers, so threads
+        # validate files in parallel
+        cpus = os.cpu_count() or 1
+        workers = min(len(paths), cpus)
+        # Split the cores between the files instead of giving each all of them
+        ctx = ValidationContext(decode_threads=max(1, cpus // workers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda path: self.validate_file(path, compute_checksum, ctx=ctx), paths
+            ))
 
 
 class PairedReadValidator:
     """Validates paired-end read consistency."""
     
-    def extract_read_id(self, header: str) -> str:
-        """Extract the read ID from FASTQ header, removing pair indicator."""
-        # Remove @ prefix and trailing pair indicators
-        read_id = header.lstrip('@').split()[0]
+    def extract_read_id(self, header: str | bytes) -> str | bytes:
+        """Extract the read ID from FASTQ header, removing pair indicator.
+
+        Bytes headers (as read by validate_pair_consistency) yield a bytes ID.
+        """
+        if isinstance(header, str):
+            return self.extract_read_id(header.encode()).decode()
         
         # Handle common pair naming conventions
         # Illumina: @READ_ID/1 or @READ_ID/2
         # Also: @READ_ID 1:... or @READ_ID 2:...
-        if read_id.endswith('/1') or read_id.endswith('/2'):
-            read_id = read_id[:-2]
-        
-        return read_id
+        return _READ_ID_RE.match(header).group(1)
     
     def validate_pair_consistency(
         self,
@@ -398,25 +867,24 @@ class PairedReadValidator:
         result = ValidationResult(status=ValidationStatus.PASS)
         
         try:
-            opener = gzip.open if r1_path.name.endswith('.gz') else open
+            opener1 = _gzip.open if _is_gzipped(r1_path) else open
+            opener2 = _gzip.open if _is_gzipped(r2_path) else open
             
-            with opener(r1_path, 'rt') as f1, opener(r2_path, 'rt') as f2:
+            with opener1(r1_path, 'rb') as f1, opener2(r2_path, 'rb') as f2:
+                headers1 = _iter_headers(f1)
+                headers2 = _iter_headers(f2)
+                match_id = _READ_ID_RE.match
                 record_count = 0
                 mismatches = []
                 
                 while record_count < num_records:
                     # Read headers
-                    h1 = f1.readline()
-                    if not h1:
+                    h1 = next(headers1, None)
+                    if h1 is None:
                         break
-                    h2 = f2.readline()
-                    
-                    # Skip other lines
-                    for _ in range(3):
-                        f1.readline()
-                        f2.readline()
+                    h2 = next(headers2, None)
                     
-                    if not h2:
+                    if h2 is None:
                         result.add_error(ValidationError(
                             code=ValidationErrorCode.PAIR_COUNT_MISMATCH,
                             message=f"R2 file has fewer reads than R1",
@@ -426,8 +894,8 @@ class PairedReadValidator:
                         break
                     
                     # Extract and compare read IDs
-                    id1 = self.extract_read_id(h1)
-                    id2 = self.extract_read_id(h2)
+                    id1 = match_id(h1).group(1)
+                    id2 = match_id(h2).group(1)
                     
                     if id1 != id2:
                         mismatches.append((record_count + 1, id1, id2))
@@ -437,9 +905,9 @@ class PairedReadValidator:
                     record_count += 1
                 
                 # Check if R1 has more reads
-                if f2.readline():  # R2 still has data
+                if next(headers2, None) is not None:  # R2 still has data
                     pass  # OK
-                elif f1.readline():  # R1 has more
+                elif next(headers1, None) is not None:  # R1 has more
                     result.add_error(ValidationError(
                         code=ValidationErrorCode.PAIR_COUNT_MISMATCH,
                         message=f"R1 file has more reads than R2",
@@ -449,7 +917,8 @@ class PairedReadValidator:
                 
                 if mismatches:
                     examples = "; ".join([
-                        f"Record {n}: R1={id1}, R2={id2}"
+                        f"Record {n}: R1={id1.decode('utf-8', 'replace')}, "
+                        f"R2={id2.decode('utf-8', 'replace')}"
                         for n, id1, id2 in mismatches[:3]
                     ])
                     result.add_error(ValidationError(
@@ -460,6 +929,24 @@ class PairedReadValidator:
                     ))
                 
                 result.metadata["records_checked"] = record_count
+            
+            # Gzip has no random access, but plain mates can cheaply have their
+            # last records compared, catching truncation past the sampled head
+            if not result.blocked and opener1 is open and opener2 is open:
+                tail1 = _last_header(r1_path)
+                tail2 = _last_header(r2_path)
+                if (
+                    tail1 and tail2
+                    and _READ_ID_RE.match(tail1).group(1) != _READ_ID_RE.match(tail2).group(1)
+                ):
+                    result.add_error(ValidationError(
+                        code=ValidationErrorCode.PAIR_ID_MISMATCH,
+                        message="Last read IDs differ between R1 and R2: "
+                               f"R1={tail1.decode('utf-8', 'replace')}, "
+                               f"R2={tail2.decode('utf-8', 'replace')}",
+                        field="pair_ids",
+                        remediation="Ensure R1 and R2 files contain matching read pairs in the same order."
+                    ))
                 
         except Exception as e:
             result.add_error(ValidationError(
@@ -475,7 +962,7 @@ class PairedReadValidator:
 class MetadataValidator:
     """Validates sample metadata schema."""
     
-    REQUIRED_FIELDS = [
+    REQUIRED_FIELDS = frozenset({
         "sample_id",
         "collection_date",
         "host",
@@ -484,34 +971,59 @@ class MetadataValidator:
         "platform",
         "run_id",
         "batch_id",
-    ]
+    })
     
-    VALID_HOSTS = ["human", "animal", "environmental"]
-    VALID_PROTOCOLS = ["amplicon", "shotgun", "capture"]
+    VALID_HOSTS = frozenset({"human", "animal", "environmental"})
+    VALID_PROTOCOLS = frozenset({"amplicon", "shotgun", "capture"})
     
-    DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+    # Stable orderings for error messages
+    _VALID_HOSTS_DISPLAY = sorted(VALID_HOSTS)
+    _VALID_PROTOCOLS_DISPLAY = sorted(VALID_PROTOCOLS)
+    
+    def __init__(self):
+        # Value checks run by validate_sample_metadata for each field present
+        self._field_validators = {
+            "collection_date": self.validate_date_format,
+            "host": self.validate_host,
+            "protocol": self.validate_protocol,
+        }
     
     def validate_required_fields(self, metadata: dict) -> ValidationResult:
         """Check all required fields are present."""
         result = ValidationResult(status=ValidationStatus.PASS)
         
-        for field in self.REQUIRED_FIELDS:
-            if field not in metadata or metadata[field] is None or str(metadata[field]).strip() == "":
-                result.add_error(ValidationError(
-                    code=ValidationErrorCode.METADATA_MISSING_FIELD,
-                    message=f"Required metadata field missing: {field}",
-                    field=field,
-                    sample_id=metadata.get("sample_id"),
-                    remediation=f"Provide a value for the '{field}' field."
-                ))
+        # Only the required keys that are present need their values inspected
+        filled = {
+            name for name in self.REQUIRED_FIELDS.intersection(metadata)
+            if metadata[name] is not None and str(metadata[name]).strip() != ""
+        }
+        
+        # Sorted so errors are reported in a reproducible order
+        for name in sorted(self.REQUIRED_FIELDS.difference(filled)):
+            result.add_error(ValidationError(
+                code=ValidationErrorCode.METADATA_MISSING_FIELD,
+                message=f"Required metadata field missing: {name}",
+                field=name,
+                sample_id=metadata.get("sample_id"),
+                remediation=f"Provide a value for the '{name}' field."
+            ))
         
         return result
     
-    def validate_date_format(self, date_str: str, field: str = "collection_date") -> ValidationResult:
-        """Validate date is in YYYY-MM-DD format."""
+    def validate_date_format(
+        self,
+        date_str: str,
+        field: str = "collection_date",
+        now: Optional[datetime] = None,
+    ) -> ValidationResult:
+        """Validate date is in YYYY-MM-DD format.
+
+        Batch callers may pass a single ``now`` for the future-date check
+        instead of reading the clock per row.
+        """
         result = ValidationResult(status=ValidationStatus.PASS)
         
-        if not self.DATE_PATTERN.match(str(date_str)):
+        if not _DATE_RE.match(str(date_str)):
             result.add_error(ValidationError(
                 code=ValidationErrorCode.METADATA_INVALID_DATE,
                 message=f"Invalid date format: {date_str}",
@@ -521,11 +1033,12 @@ class MetadataValidator:
         else:
             # Validate date is reasonable
             try:
-                from datetime import datetime
-                date = datetime.strptime(date_str, "%Y-%m-%d")
+                # The regex fixed the layout, so build the date directly
+                # rather than through strptime
+                date = datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
                 
                 # Check date is not in the future
-                if date > datetime.now():
+                if date > (now or datetime.now()):
                     result.add_warning(ValidationWarning(
                         code="DATE_IN_FUTURE",
                         message=f"Collection date is in the future: {date_str}",
@@ -556,7 +1069,7 @@ class MetadataValidator:
         if host.lower() not in self.VALID_HOSTS:
             result.add_warning(ValidationWarning(
                 code="UNKNOWN_HOST",
-                message=f"Unknown host type: {host}. Expected one of: {self.VALID_HOSTS}",
+                message=f"Unknown host type: {host}. Expected one of: {self._VALID_HOSTS_DISPLAY}",
                 field="host",
             ))
         
@@ -569,9 +1082,9 @@ class MetadataValidator:
         if protocol.lower() not in self.VALID_PROTOCOLS:
             result.add_error(ValidationError(
                 code=ValidationErrorCode.METADATA_INVALID_VALUE,
-                message=f"Invalid protocol: {protocol}. Must be one of: {self.VALID_PROTOCOLS}",
+                message=f"Invalid protocol: {protocol}. Must be one of: {self._VALID_PROTOCOLS_DISPLAY}",
                 field="protocol",
-                remediation=f"Use one of the valid protocols: {self.VALID_PROTOCOLS}"
+                remediation=f"Use one of the valid protocols: {self._VALID_PROTOCOLS_DISPLAY}"
             ))
         
         return result
@@ -583,41 +1096,57 @@ class MetadataValidator:
         # Required fields
         result.merge(self.validate_required_fields(metadata))
         
-        # If we have collection_date, validate format
-        if "collection_date" in metadata and metadata["collection_date"]:
-            result.merge(self.validate_date_format(str(metadata["collection_date"])))
-        
-        # Validate host
-        if "host" in metadata and metadata["host"]:
-            result.merge(self.validate_host(str(metadata["host"])))
-        
-        # Validate protocol
-        if "protocol" in metadata and metadata["protocol"]:
-            result.merge(self.validate_protocol(str(metadata["protocol"])))
+        # Field values (collection date, host, protocol) when provided
+        for name, validator in self._field_validators.items():
+            value = metadata.get(name)
+            if value:
+                result.merge(validator(str(value)))
         
         return result
 
 
+class PrimerSchemeInfo(NamedTuple):
+    """Amplicon geometry of a known primer scheme."""
+    amplicon_length: int
+    overlap: int
+
+
+# Keyed by canonical name (see normalize_scheme_name), so
+# legacy spellings such as "ARTIC_v4" resolve to the standard "ARTIC-V4"
+# naming used by ReferenceManager.
+_KNOWN_SCHEMES = MappingProxyType({
+    "ARTIC-V3": PrimerSchemeInfo(amplicon_length=400, overlap=50),
+    "ARTIC-V4": PrimerSchemeInfo(amplicon_length=400, overlap=50),
+    "ARTIC-V4.1": PrimerSchemeInfo(amplicon_length=400, overlap=50),
+    "ARTIC-V5": PrimerSchemeInfo(amplicon_length=400, overlap=50),
+    "ARTIC-V5.3.2": PrimerSchemeInfo(amplicon_length=400, overlap=50),
+    "MIDNIGHT": PrimerSchemeInfo(amplicon_length=1200, overlap=100),
+})
+
+
 class AmpliconValidator:
     """Validates amplicon-specific requirements."""
     
-    KNOWN_SCHEMES = {
-        # Underscore versions (legacy)
-        "ARTIC_v3": {"amplicon_length": 400, "overlap": 50},
-        "ARTIC_v4": {"amplicon_length": 400, "overlap": 50},
-        "ARTIC_v4.1": {"amplicon_length": 400, "overlap": 50},
-        "ARTIC_v5": {"amplicon_length": 400, "overlap": 50},
-        "midnight": {"amplicon_length": 1200, "overlap": 100},
-        # Hyphenated versions (standard naming from ReferenceManager)
-        "ARTIC-V3": {"amplicon_length": 400, "overlap": 50},
-        "ARTIC-V4": {"amplicon_length": 400, "overlap": 50},
-        "ARTIC-V4.1": {"amplicon_length": 400, "overlap": 50},
-        "ARTIC-V5": {"amplicon_length": 400, "overlap": 50},
-        "ARTIC-V5.3.2": {"amplicon_length": 400, "overlap": 50},
-    }
+    KNOWN_SCHEMES = _KNOWN_SCHEMES
     
     def __init__(self, schemes_dir: Optional[Path] = None):
         self.schemes_dir = schemes_dir
+        self._scheme_files: Optional[frozenset[str]] = None
+    
+    def _list_scheme_files(self) -> frozenset[str]:
+        """Names in schemes_dir, read with one scandir per validator.
+
+        Replaces a stat per scheme lookup; a missing directory lists empty.
+        """
+        if self._scheme_files is None:
+            try:
+                with os.scandir(self.schemes_dir) as entries:
+                    self._scheme_files = frozenset(entry.name for entry in entries)
+            except OSError:
+                self._scheme_files = frozenset()
+        return self._scheme_files
+    
+    normalize_scheme_name = staticmethod(normalize_scheme_name)
     
     def validate_primer_scheme_exists(
         self,
@@ -628,8 +1157,9 @@ class AmpliconValidator:
         result = ValidationResult(status=ValidationStatus.PASS)
         
         # Check known schemes
-        if scheme_name in self.KNOWN_SCHEMES:
-            result.metadata["scheme_info"] = self.KNOWN_SCHEMES[scheme_name]
+        scheme = self.KNOWN_SCHEMES.get(self.normalize_scheme_name(scheme_name))
+        if scheme is not None:
+            result.metadata["scheme_info"] = scheme._asdict()
             return result
         
         # Check custom scheme file
@@ -645,8 +1175,7 @@ class AmpliconValidator:
                 result.merge(self.validate_bed_format(scheme_file))
         elif self.schemes_dir:
             # Look for scheme in schemes directory
-            scheme_path = self.schemes_dir / f"{scheme_name}.bed"
-            if not scheme_path.exists():
+            if f"{scheme_name}.bed" not in self._list_scheme_files():
                 result.add_error(ValidationError(
                     code=ValidationErrorCode.PRIMER_SCHEME_NOT_FOUND,
                     message=f"Unknown primer scheme: {scheme_name}",
@@ -670,43 +1199,49 @@ class AmpliconValidator:
         result = ValidationResult(status=ValidationStatus.PASS)
         
         try:
-            with open(bed_path, 'r') as f:
-                line_count = 0
-                for line in f:
-                    line_count += 1
-                    if line.startswith('#') or not line.strip():
-                        continue
-                    
-                    fields = line.strip().split('\t')
-                    if len(fields) < 6:
-                        result.add_error(ValidationError(
-                            code=ValidationErrorCode.PRIMER_SCHEME_INVALID,
-                            message=f"BED file has fewer than 6 columns at line {line_count}",
-                            field="primer_bed",
-                            remediation="Primer BED must have: chrom, start, end, name, score, strand"
-                        ))
-                        break
-                    
-                    # Validate coordinates are numeric
-                    try:
-                        start = int(fields[1])
-                        end = int(fields[2])
-                        if start >= end:
-                            result.add_warning(ValidationWarning(
-                                code="INVALID_COORDINATES",
-                                message=f"Start >= end at line {line_count}",
+            with open(bed_path, 'rb') as f:
+                # mmap cannot map an empty file
+                if not os.fstat(f.fileno()).st_size:
+                    result.metadata["primer_count"] = 0
+                    return result
+                
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    line_count = 0
+                    for line in iter(mm.readline, b''):
+                        line_count += 1
+                        if line.startswith(b'#') or not line.strip():
+                            continue
+                        
+                        fields = line.strip().split(b'\t')
+                        if len(fields) < 6:
+                            result.add_error(ValidationError(
+                                code=ValidationErrorCode.PRIMER_SCHEME_INVALID,
+                                message=f"BED file has fewer than 6 columns at line {line_count}",
                                 field="primer_bed",
+                                remediation="Primer BED must have: chrom, start, end, name, score, strand"
                             ))
-                    except ValueError:
-                        result.add_error(ValidationError(
-                            code=ValidationErrorCode.PRIMER_SCHEME_INVALID,
-                            message=f"Non-numeric coordinates at line {line_count}",
-                            field="primer_bed",
-                            remediation="BED start and end must be integers."
-                        ))
-                        break
-                
-                result.metadata["primer_count"] = line_count
+                            break
+                        
+                        # Validate coordinates are numeric
+                        try:
+                            start = int(fields[1])
+                            end = int(fields[2])
+                            if start >= end:
+                                result.add_warning(ValidationWarning(
+                                    code="INVALID_COORDINATES",
+                                    message=f"Start >= end at line {line_count}",
+                                    field="primer_bed",
+                                ))
+                        except ValueError:
+                            result.add_error(ValidationError(
+                                code=ValidationErrorCode.PRIMER_SCHEME_INVALID,
+                                message=f"Non-numeric coordinates at line {line_count}",
+                                field="primer_bed",
+                                remediation="BED start and end must be integers."
+                            ))
+                            break
+                    
+                    result.metadata["primer_count"] = line_count
                 
         except Exception as e:
             result.add_error(ValidationError(
@@ -732,11 +1267,11 @@ class AmpliconValidator:
         """
         result = ValidationResult(status=ValidationStatus.PASS)
         
-        if scheme_name not in self.KNOWN_SCHEMES:
+        scheme = self.KNOWN_SCHEMES.get(self.normalize_scheme_name(scheme_name))
+        if scheme is None:
             return result  # Can't validate unknown schemes
         
-        scheme = self.KNOWN_SCHEMES[scheme_name]
-        amplicon_length = scheme["amplicon_length"]
+        amplicon_length = scheme.amplicon_length
         
         # For paired reads, calculate expected overlap
         # Assuming paired-end reads from both ends of amplicon
@@ -767,11 +1302,15 @@ class AmpliconValidator:
 class ReferenceValidator:
     """Validates reference databases are available."""
     
-    def validate_reference_exists(self, ref_path: Path) -> ValidationResult:
+    def validate_reference_exists(
+        self,
+        ref_path: Path,
+        ctx: Optional[ValidationContext] = None,
+    ) -> ValidationResult:
         """Check reference file exists."""
         result = ValidationResult(status=ValidationStatus.PASS)
         
-        if not ref_path.exists():
+        if (ctx.stat(ref_path) if ctx else _stat(ref_path)) is None:
             result.add_error(ValidationError(
                 code=ValidationErrorCode.REFERENCE_NOT_FOUND,
                 message=f"Reference file not found: {ref_path}",
@@ -784,12 +1323,13 @@ class ReferenceValidator:
     def validate_database_exists(
         self,
         db_type: str,
-        db_path: Path
+        db_path: Path,
+        ctx: Optional[ValidationContext] = None,
     ) -> ValidationResult:
         """Check database directory exists."""
         result = ValidationResult(status=ValidationStatus.PASS)
         
-        if not db_path.exists():
+        if (ctx.stat(db_path) if ctx else _stat(db_path)) is None:
             result.add_error(ValidationError(
                 code=ValidationErrorCode.DATABASE_NOT_FOUND,
                 message=f"{db_type} database not found at: {db_path}",
@@ -813,6 +1353,7 @@ class PreflightValidator:
         max_file_size_gb: float = 20.0,
         schemes_dir: Optional[Path] = None,
         references_dir: Optional[Path] = None,
+        full_gzip_check: bool = False,
     ):
         self.fastq_validator = FASTQValidator(max_file_size_gb=max_file_size_gb)
         self.pair_validator = PairedReadValidator()
@@ -820,6 +1361,8 @@ class PreflightValidator:
         self.amplicon_validator = AmpliconValidator(schemes_dir=schemes_dir)
         self.reference_validator = ReferenceValidator()
         self.references_dir = references_dir
+        # Inflate every gzipped FASTQ to verify its CRC (rapidgzip when installed)
+        self.full_gzip_check = full_gzip_check
     
     def validate_sample(
         self,
@@ -828,6 +1371,8 @@ class PreflightValidator:
         metadata: dict,
         mode: str = "amplicon",
         primer_scheme: Optional[str] = None,
+        ctx: Optional[ValidationContext] = None,
+        fast_fail: bool = True,
     ) -> ValidationResult:
         """
         Run all validations for a single sample.
@@ -838,6 +1383,10 @@ class PreflightValidator:
             metadata: Sample metadata dictionary
             mode: Pipeline mode (amplicon or shotgun)
             primer_scheme: Primer scheme name for amplicon mode
+            ctx: Optional per-run context caching file stats
+            fast_fail: Run the cheap metadata, primer scheme and file existence
+                checks before reading any FASTQ content; when False, files are
+                validated first, as in diagnostic runs
         
         Returns:
             ValidationResult with all errors and warnings
@@ -847,9 +1396,21 @@ class PreflightValidator:
         
         logger.info("Validating sample", sample_id=result.metadata["sample_id"])
         
+        if fast_fail:
+            self._validate_sample_setup(result, metadata, mode, primer_scheme, ctx)
+            for path in (r1_path, r2_path):
+                if path and not result.blocked:
+                    st = ctx.stat(path) if ctx else _stat(path)
+                    result.merge(self.fastq_validator._validate_file_exists(path, st))
+            
+            if result.blocked:
+                return result
+        
         # Validate R1
         logger.debug("Validating R1 file", path=str(r1_path))
-        r1_result = self.fastq_validator.validate_file(r1_path)
+        r1_result = self.fastq_validator.validate_file(
+            r1_path, fast_integrity_check=self.full_gzip_check, ctx=ctx
+        )
         result.merge(r1_result)
         result.metadata["r1"] = r1_result.metadata
         
@@ -859,7 +1420,9 @@ class PreflightValidator:
         # Validate R2 if paired
         if r2_path:
             logger.debug("Validating R2 file", path=str(r2_path))
-            r2_result = self.fastq_validator.validate_file(r2_path)
+            r2_result = self.fastq_validator.validate_file(
+                r2_path, fast_integrity_check=self.full_gzip_check, ctx=ctx
+            )
             result.merge(r2_result)
             result.metadata["r2"] = r2_result.metadata
             
@@ -874,37 +1437,66 @@ class PreflightValidator:
         if result.blocked:
             return result
         
+        if not fast_fail:
+            self._validate_sample_setup(result, metadata, mode, primer_scheme, ctx)
+            if result.blocked:
+                return result
+        
+        # Check amplicon overlap if we have read length info
+        if mode == "amplicon" and primer_scheme and r1_result.metadata.get("read_length_mean"):
+            read_length = int(r1_result.metadata["read_length_mean"])
+            check_overlap = partial(
+                self.amplicon_validator.validate_overlap_sufficiency,
+                read_length,
+                primer_scheme,
+            )
+            if ctx:
+                overlap_result = ctx.cached_check(
+                    ("overlap", read_length, primer_scheme), check_overlap
+                )
+            else:
+                overlap_result = check_overlap()
+            result.merge(overlap_result)
+        
+        return result
+    
+    def _validate_sample_setup(
+        self,
+        result: ValidationResult,
+        metadata: dict,
+        mode: str,
+        primer_scheme: Optional[str],
+        ctx: Optional[ValidationContext],
+    ) -> None:
+        """Merge the metadata and primer scheme checks of a sample into result."""
         # Validate metadata
         logger.debug("Validating metadata")
         meta_result = self.metadata_validator.validate_sample_metadata(metadata)
         result.merge(meta_result)
         
-        if result.blocked:
-            return result
+        if result.blocked or mode != "amplicon":
+            return
         
         # Amplicon-specific validations
-        if mode == "amplicon":
-            if not primer_scheme:
-                result.add_error(ValidationError(
-                    code=ValidationErrorCode.PRIMER_SCHEME_NOT_FOUND,
-                    message="Amplicon mode requires a primer scheme",
-                    field="primer_scheme",
-                    remediation="Specify the primer scheme (e.g., ARTIC_v4.1)"
-                ))
-            else:
-                logger.debug("Validating primer scheme", scheme=primer_scheme)
-                scheme_result = self.amplicon_validator.validate_primer_scheme_exists(primer_scheme)
-                result.merge(scheme_result)
-                
-                # Check overlap if we have read length info
-                if r1_result.metadata.get("read_length_mean"):
-                    overlap_result = self.amplicon_validator.validate_overlap_sufficiency(
-                        int(r1_result.metadata["read_length_mean"]),
-                        primer_scheme
-                    )
-                    result.merge(overlap_result)
-        
-        return result
+        if not primer_scheme:
+            result.add_error(ValidationError(
+                code=ValidationErrorCode.PRIMER_SCHEME_NOT_FOUND,
+                message="Amplicon mode requires a primer scheme",
+                field="primer_scheme",
+                remediation="Specify the primer scheme (e.g., ARTIC_v4.1)"
+            ))
+            return
+        
+        logger.debug("Validating primer scheme", scheme=primer_scheme)
+        check_scheme = partial(
+            self.amplicon_validator.validate_primer_scheme_exists, primer_scheme
+        )
+        # The scheme is shared by the whole run; check it once per run
+        if ctx:
+            scheme_result = ctx.cached_check(("primer_scheme", primer_scheme), check_scheme)
+        else:
+            scheme_result = check_scheme()
+        result.merge(scheme_result)
     
     def validate_run(
         self,
@@ -913,6 +1505,7 @@ class PreflightValidator:
         primer_scheme: Optional[str] = None,
         reference_path: Optional[Path] = None,
         lineage_db_path: Optional[Path] = None,
+        collect_details: bool = True,
     ) -> ValidationResult:
         """
         Run all validations for a complete run.
@@ -923,6 +1516,8 @@ class PreflightValidator:
             primer_scheme: Primer scheme for amplicon mode
             reference_path: Path to reference genome
             lineage_db_path: Path to lineage database
+            collect_details: Serialize each sample's result into
+                metadata["sample_validations"]; when False it is None
         
         Returns:
             Combined ValidationResult for all samples
@@ -934,15 +1529,32 @@ class PreflightValidator:
         logger.info("Starting pre-flight validation", 
                    sample_count=len(samples), mode=mode)
         
+        # Stat every path the run touches up front, in one concurrent batch
+        entries = [
+            (
+                Path(sample["r1_path"]),
+                Path(sample["r2_path"]) if sample.get("r2_path") else None,
+                sample.get("metadata", sample),
+            )
+            for sample in samples
+        ]
+        ctx = ValidationContext()
+        ctx.prefetch(
+            [path for path in (reference_path, lineage_db_path) if path]
+            + [path for r1_path, r2_path, _ in entries for path in (r1_path, r2_path) if path]
+        )
+        
         # Validate reference if specified
         if reference_path:
-            ref_result = self.reference_validator.validate_reference_exists(reference_path)
+            ref_result = self.reference_validator.validate_reference_exists(
+                reference_path, ctx=ctx
+            )
             result.merge(ref_result)
         
         # Validate lineage database if specified
         if lineage_db_path:
             db_result = self.reference_validator.validate_database_exists(
-                "lineage", lineage_db_path
+                "lineage", lineage_db_path, ctx=ctx
             )
             result.merge(db_result)
         
@@ -950,29 +1562,47 @@ class PreflightValidator:
             return result
         
         # Validate each sample
-        sample_results = []
-        for sample in samples:
-            r1_path = Path(sample["r1_path"])
-            r2_path = Path(sample["r2_path"]) if sample.get("r2_path") else None
-            metadata = sample.get("metadata", sample)
+        def validate_entry(entry: tuple) -> ValidationResult:
+            r1_path, r2_path, metadata = entry
             
-            sample_result = self.validate_sample(
+            return self.validate_sample(
                 r1_path=r1_path,
                 r2_path=r2_path,
                 metadata=metadata,
                 mode=mode,
                 primer_scheme=primer_scheme,
+                ctx=ctx,
             )
-            sample_results.append(sample_result)
+        
+        if len(samples) <= 1:
+            sample_results = [validate_entry(entry) for entry in entries]
+        else:
+            # Samples are independent and their cost is hashing and inflating,
+            # which release the GIL, so threads validate them in parallel
+            cpus = os.cpu_count() or 1
+            workers = min(len(samples), cpus)
+            # Split the cores between the samples instead of giving each all of them
+            ctx.decode_threads = max(1, cpus // workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                sample_results = list(executor.map(validate_entry, entries))
+        
+        # Merge, serialize and tally the sample results in one pass
+        passed = failed = warnings = 0
+        sample_validations = [] if collect_details else None
+        for sample_result in sample_results:
             result.merge(sample_result)
+            if collect_details:
+                sample_validations.append(sample_result.to_dict())
+            if sample_result.status == ValidationStatus.PASS:
+                passed += 1
+            elif sample_result.status == ValidationStatus.FAIL:
+                failed += 1
+            else:
+                warnings += 1
         
-        result.metadata["sample_validations"] = [r.to_dict() for r in sample_results]
+        result.metadata["sample_validations"] = sample_validations
         
         # Summary
-        passed = sum(1 for r in sample_results if r.passed)
-        failed = sum(1 for r in sample_results if r.blocked)
-        warnings = sum(1 for r in sample_results if r.status == ValidationStatus.WARNING)
-        
         result.metadata["summary"] = {
             "passed": passed,
             "failed": failed,
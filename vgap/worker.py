@@ -7,30 +7,35 @@ from celery import Celery
 from vgap.config import get_settings
 
 settings = get_settings()
+celery_settings = settings.celery
 
 # Create Celery app
 celery_app = Celery(
     "vgap",
-    broker=settings.celery.broker_url,
-    backend=settings.celery.result_backend,
+    broker=celery_settings.broker_url,
+    backend=celery_settings.result_backend,
+    # Task modules, listed explicitly rather than discovered at startup
+    include=["vgap.services.pipeline", "vgap.tasks.maintenance"],
 )
 
 # Configure
 celery_app.conf.update(
-    task_serializer=settings.celery.task_serializer,
-    result_serializer=settings.celery.result_serializer,
-    accept_content=settings.celery.accept_content,
-    timezone=settings.celery.timezone,
-    enable_utc=settings.celery.enable_utc,
-    task_track_started=settings.celery.task_track_started,
-    task_time_limit=settings.celery.task_time_limit,
-    worker_prefetch_multiplier=settings.celery.worker_prefetch_multiplier,
-    worker_concurrency=settings.celery.worker_concurrency,
+    task_serializer=celery_settings.task_serializer,
+    result_serializer=celery_settings.result_serializer,
+    accept_content=celery_settings.accept_content,
+    timezone=celery_settings.timezone,
+    enable_utc=celery_settings.enable_utc,
+    task_track_started=celery_settings.task_track_started,
+    task_time_limit=celery_settings.task_time_limit,
+    worker_prefetch_multiplier=celery_settings.worker_prefetch_multiplier,
+    worker_concurrency=celery_settings.worker_concurrency,
+    # No task sets a rate limit, so skip the per-task token buckets
+    worker_disable_rate_limits=True,
+    # Heavy modules the pipeline tasks import lazily; importing them in the
+    # parent lets prefork children share them instead of each re-importing
+    imports=("plotly.graph_objects", "jinja2"),
 )
 
-# Auto-discover tasks
-celery_app.autodiscover_tasks(["vgap.services", "vgap.tasks"])
-
 
 def main():
     """Entry point for worker."""